@@ -0,0 +1,205 @@
+"""
+Benchmarky pre kooperatívny koevolučný algoritmus
+
+Meria rýchlosť jadra algoritmu na mriežke parametrov (dimenzie, počet
+druhov, veľkosť populácie, problém):
+- mikro benchmarky: čas jednotlivých operácií (selekcia, kríženie, mutácia,
+  evaluácia jedinca, evaluácia populácie, zostavenie najlepšieho riešenia)
+- makro benchmarky: čas na generáciu, evaluácie za sekundu, špičková pamäť
+
+Výsledky sa uložia do JSON súboru, aby sa dali porovnávať medzi verziami.
+
+Použitie:
+    python benchmarks.py                  # rýchla mriežka
+    python benchmarks.py --preset full    # dimenzie až 100 000
+"""
+
+import argparse
+import functools
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+from cooperative_coevolution import CooperativeCoevolution
+from problems import get_rastrigin_problem, get_model_optimization_problem
+from large_scale_problems import get_large_scale_problem
+
+
+# Problémy, na ktorých meriame
+PROBLEMS = {
+    'rastrigin': get_rastrigin_problem,
+    'model': get_model_optimization_problem,
+    # Neseparovateľné veľkorozmerné problémy (LSGO)
+    'partial_rastrigin': functools.partial(get_large_scale_problem, 'partial_rastrigin'),
+    'overlapping_elliptic': functools.partial(get_large_scale_problem, 'overlapping_elliptic'),
+}
+
+# Mriežky parametrov
+PRESETS = {
+    'quick': {
+        'dimensions': [30, 1000, 10000],
+        'num_species': [4, 20],
+        'population_size': [50, 200],
+    },
+    'full': {
+        'dimensions': [30, 1000, 10000, 100000],
+        'num_species': [4, 20, 100],
+        'population_size': [50, 200, 500],
+    },
+}
+
+
+def time_call(func, repeat):
+    """
+    Zmeria čas volania funkcie
+
+    Vráti slovník s najlepším a mediánovým časom (v sekundách) z `repeat` meraní.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'best': min(times), 'median': float(np.median(times))}
+
+
+def create_algorithm(problem, dimensions, num_species, population_size, generations):
+    """Vytvorí algoritmus pre daný bod mriežky (bez výpisov a histórie riešení)"""
+    fitness_function, dims, bounds = PROBLEMS[problem](dimensions)
+    return CooperativeCoevolution(
+        fitness_function=fitness_function,
+        dimensions=dims,
+        bounds=bounds,
+        num_species=num_species,
+        population_size=population_size,
+        generations=generations,
+        history_every=0,
+        verbose=False,
+        seed=0
+    )
+
+
+def micro_benchmark(ccea, repeat):
+    """Zmeria jednotlivé operácie algoritmu (populácie musia byť ohodnotené)"""
+    ga = ccea.genetic_algorithms[0]
+    pop = ccea.populations[0]
+    parents = pop.genes[ga.select_indices()]
+    offspring = ga.crossover_batch(parents)
+    best = pop.get_best()
+
+    return {
+        'selection': time_call(ga.select_indices, repeat),
+        'crossover': time_call(lambda: ga.crossover_batch(parents), repeat),
+        'mutation': time_call(lambda: ga.mutate_batch(offspring.copy()), repeat),
+        '_evaluate_individual': time_call(
+            lambda: ccea._evaluate_individual(0, best), repeat),
+        '_evaluate_block': time_call(
+            lambda: ccea._evaluate_block(0, pop.genes), repeat),
+        '_get_best_solution': time_call(ccea._get_best_solution, repeat),
+    }
+
+
+def macro_benchmark(problem, dimensions, num_species, population_size, generations):
+    """Zmeria celý beh - čas na generáciu, evaluácie za sekundu a pamäť"""
+    ccea = create_algorithm(problem, dimensions, num_species, population_size, generations)
+    start = time.perf_counter()
+    ccea.run()
+    elapsed = time.perf_counter() - start
+
+    # Špičkovú pamäť meriame zvlášť (tracemalloc spomaľuje alokácie)
+    tracemalloc.start()
+    memory_run = create_algorithm(problem, dimensions, num_species, population_size, 1)
+    memory_run.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'elapsed': elapsed,
+        'time_per_generation': elapsed / max(1, ccea.generations_completed),
+        'evaluations': ccea.evaluations,
+        'evaluations_per_second': ccea.evaluations / elapsed if elapsed > 0 else 0.0,
+        'peak_memory_bytes': peak,
+        'best_fitness': float(ccea.best_fitness_history[-1]),
+    }
+
+
+def run_benchmarks(preset='quick', problems=None, generations=5, repeat=5, grid=None):
+    """
+    Spustí benchmarky pre všetky body mriežky
+
+    preset: názov mriežky z PRESETS
+    problems: zoznam problémov (None = všetky)
+    generations: počet generácií v makro benchmarku
+    repeat: počet opakovaní mikro meraní
+    grid: vlastná mriežka (slovník ako v PRESETS), má prednosť pred presetom
+
+    Vráti slovník s metadátami a zoznamom výsledkov.
+    """
+    grid = grid if grid is not None else PRESETS[preset]
+    problems = problems if problems is not None else list(PROBLEMS)
+    results = []
+
+    points = list(itertools.product(
+        problems, grid['dimensions'], grid['num_species'], grid['population_size']
+    ))
+    for index, (problem, dimensions, num_species, population_size) in enumerate(points, start=1):
+        if num_species > dimensions:
+            continue
+        print(f"[{index}/{len(points)}] {problem}: D={dimensions}, "
+              f"druhy={num_species}, populácia={population_size}")
+
+        ccea = create_algorithm(problem, dimensions, num_species, population_size, generations)
+        for i in range(ccea.num_species):
+            ccea._evaluate_population(i)
+
+        result = {
+            'problem': problem,
+            'dimensions': dimensions,
+            'num_species': num_species,
+            'population_size': population_size,
+            'delta_evaluation': bool(ccea.delta_evaluation),
+            'micro': micro_benchmark(ccea, repeat),
+            'macro': macro_benchmark(problem, dimensions, num_species,
+                                     population_size, generations),
+        }
+        results.append(result)
+        print(f"  {result['macro']['time_per_generation'] * 1000:.1f} ms/generácia, "
+              f"{result['macro']['evaluations_per_second']:.0f} evaluácií/s, "
+              f"pamäť {result['macro']['peak_memory_bytes'] / 2**20:.1f} MiB")
+
+    return {
+        'metadata': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'preset': preset,
+            'generations': generations,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    """Spustí benchmarky z príkazového riadku a uloží výsledky do JSON"""
+    parser = argparse.ArgumentParser(description="Benchmarky CCEA")
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick')
+    parser.add_argument('--problems', nargs='+', choices=sorted(PROBLEMS))
+    parser.add_argument('--generations', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default='benchmark_results.json')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.preset, args.problems, args.generations, args.repeat)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nVýsledky uložené do '{args.output}'")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,174 +5,480 @@ Jednoduchá implementácia algoritmu, ktorý rozdeľuje veľký problém na men
 Každá časť sa rieši samostatne pomocou genetického algoritmu.
 """
 
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import random
+
+from decomposition import get_grouping
+from evaluators import AsyncEvaluator
+
+
+# Maximálny počet čísel v jednej dávke riešení (N, dimensions) pri evaluácii
+MAX_BATCH_ELEMENTS = 2 ** 22
+
+# Predvolený podiel rozpočtu behu (max_evaluations) pre zoskupenie groups='auto'
+GROUPING_BUDGET_SHARE = 0.5
 
 
 class Individual:
-    """Jeden jedinec v populácii - má svoje gény a fitness hodnotu"""
+    """
+    Jeden jedinec v populácii - má svoje gény a fitness hodnotu
+
+    Jedinec môže byť samostatný (má vlastné pole génov) alebo len pohľad
+    (view) na jeden riadok matice génov v populácii. Pohľad nič nekopíruje -
+    čítanie aj zápis idú priamo do polí populácie.
+    """
+    
+    __slots__ = ('_genes', '_fitness', '_population', '_index')
+    
+    def __init__(self, genes, fitness=-999999, population=None, index=None):
+        # Samostatný jedinec má vlastné gény a fitness
+        self._genes = genes
+        self._fitness = fitness
+        # Pohľad na riadok populácie (ak population nie je None)
+        self._population = population
+        self._index = index
     
-    def __init__(self, genes, fitness=-999999):
+    @classmethod
+    def view(cls, population, index):
+        """Vytvorí pohľad na jedinca s indexom `index` v populácii"""
+        return cls(None, population=population, index=index)
+    
+    @property
+    def genes(self):
         # Gény = hodnoty riešenia (napr. [1.5, -2.3, 0.8, ...])
-        self.genes = genes
+        if self._population is not None:
+            return self._population.genes[self._index]
+        return self._genes
+    
+    @genes.setter
+    def genes(self, value):
+        if self._population is not None:
+            self._population.genes[self._index] = value
+        else:
+            self._genes = value
+    
+    @property
+    def fitness(self):
         # Fitness = ako dobré je toto riešenie (čím väčšie, tým lepšie)
-        self.fitness = fitness
+        if self._population is not None:
+            return float(self._population.fitness[self._index])
+        return self._fitness
+    
+    @fitness.setter
+    def fitness(self, value):
+        if self._population is not None:
+            self._population.assign_fitness([value], [self._index])
+        else:
+            self._fitness = value
     
     def copy(self):
-        """Vytvorí kópiu jedinca"""
+        """Vytvorí kópiu jedinca (vždy samostatnú, nie pohľad)"""
         return Individual(self.genes.copy(), self.fitness)
 
 
 class Population:
-    """Populácia = skupina jedincov, ktorí sa vyvíjajú"""
+    """
+    Populácia = skupina jedincov, ktorí sa vyvíjajú
+
+    Jedinci sú uložení ako "structure of arrays": jedna súvislá matica génov
+    tvaru (size, dimension) a jeden vektor fitness hodnôt. Zoznam objektov
+    `Individual` sa vytvára len na požiadanie (vlastnosť `individuals`)
+    kvôli spätnej kompatibilite.
+
+    Index najlepšieho jedinca (a množina elity) sa udržiava priebežne pri
+    každom priradení fitness cez `assign_fitness`, takže `get_best` je O(1).
+    Fitness sa preto nemá zapisovať priamo do poľa `fitness`.
+    """
     
-    def __init__(self, size, dimension, bounds):
+    def __init__(self, size, dimension, bounds, elite_size=1, rng=None):
         # Koľko jedincov je v populácii
         self.size = size
         # Koľko dimenzií má každý jedinec (koľko čísel v génoch)
         self.dimension = dimension
         # Hranice pre hodnoty génov (min, max)
         self.bounds = bounds
-        # Zoznam všetkých jedincov
-        self.individuals = []
+        # Generátor náhodných čísel (np.random.Generator) tejto populácie
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Matica génov - riadok = jeden jedinec
+        self.genes = np.empty((size, dimension))
+        # Fitness hodnoty všetkých jedincov
+        self.fitness = np.full(size, -999999.0)
+        # Koľko najlepších jedincov sledujeme ako elitu
+        self.elite_size = max(1, min(elite_size, size))
+        # Index najlepšieho jedinca a indexy elity (od najlepšieho)
+        self.best_index = 0
+        self.elite_indices = np.arange(self.elite_size)
         # Vytvoríme počiatočnú populáciu
         self._create_initial_population()
     
     def _create_initial_population(self):
         """Vytvorí počiatočnú populáciu náhodnými jedincami"""
-        self.individuals = []
-        for i in range(self.size):
-            # Vytvoríme náhodné gény v rámci hraníc
-            genes = np.random.uniform(
-                self.bounds[0],  # minimálna hodnota
-                self.bounds[1],  # maximálna hodnota
-                self.dimension   # koľko čísel
-            )
-            # Pridáme nového jedinca
-            self.individuals.append(Individual(genes))
+        # Všetky gény vygenerujeme naraz v rámci hraníc
+        self.genes[:] = self.rng.uniform(
+            self.bounds[0],  # minimálna hodnota
+            self.bounds[1],  # maximálna hodnota
+            (self.size, self.dimension)
+        )
+        self.assign_fitness(np.full(self.size, -999999.0))
+    
+    @property
+    def individuals(self):
+        """Zoznam pohľadov na jedincov (len pre spätnú kompatibilitu)"""
+        return [Individual.view(self, i) for i in range(self.size)]
+    
+    @individuals.setter
+    def individuals(self, individuals):
+        # Skopírujeme gény a fitness zo zoznamu jedincov do polí populácie
+        genes = np.array([ind.genes for ind in individuals], dtype=float)
+        fitness = np.array([ind.fitness for ind in individuals], dtype=float)
+        self.set_arrays(genes, fitness)
+    
+    def set_arrays(self, genes, fitness):
+        """Nahradí obsah populácie novou maticou génov a vektorom fitness"""
+        self.genes[:] = genes
+        self.assign_fitness(fitness)
+    
+    def assign_fitness(self, values, indices=None):
+        """
+        Priradí fitness hodnoty a priebežne aktualizuje najlepšieho a elitu
+
+        values: nové fitness hodnoty
+        indices: ktorým jedincom patria (None = celej populácii)
+        """
+        if indices is None:
+            self.fitness[:] = values
+            self._rebuild_elite()
+            return
+        
+        indices = np.asarray(indices, dtype=int)
+        values = np.asarray(values, dtype=float)
+        # Ak sa zhoršil niektorý člen elity, musíme elitu nájsť odznova
+        old_elite = self.fitness[self.elite_indices].copy()
+        self.fitness[indices] = values
+        if np.any(self.fitness[self.elite_indices] < old_elite):
+            self._rebuild_elite()
+            return
+        
+        # Inak nová elita je medzi starou elitou a práve zmenenými jedincami
+        candidates = np.union1d(self.elite_indices, indices)
+        self._set_elite(candidates)
+    
+    def _rebuild_elite(self):
+        """Nájde najlepšieho a elitu prechodom cez celú populáciu"""
+        self._set_elite(np.arange(self.size))
+    
+    def _set_elite(self, candidates):
+        """Vyberie elitu (a najlepšieho) spomedzi kandidátov"""
+        k = self.elite_size
+        if k == 1:
+            # Najčastejší prípad - stačí jeden argmax (pri zhode menší index)
+            self.best_index = int(candidates[np.argmax(self.fitness[candidates])])
+            self.elite_indices = np.array([self.best_index])
+            return
+        if len(candidates) > k:
+            top = np.argpartition(-self.fitness[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        # Zoradíme od najlepšieho (pri zhode vyhrá menší index)
+        order = np.lexsort((candidates, -self.fitness[candidates]))
+        self.elite_indices = candidates[order]
+        self.best_index = int(self.elite_indices[0])
+    
+    def get_best_index(self):
+        """Vráti index najlepšieho jedinca (s najväčšou fitness) - O(1)"""
+        return self.best_index
+    
+    def get_elite(self):
+        """Vráti indexy elity zoradené od najlepšieho jedinca"""
+        return self.elite_indices
     
     def get_best(self):
         """Vráti najlepšieho jedinca (s najväčšou fitness)"""
-        best = self.individuals[0]
-        for ind in self.individuals:
-            if ind.fitness > best.fitness:
-                best = ind
-        return best
+        return Individual.view(self, self.get_best_index())
     
     def get_random_individual(self):
         """Vráti náhodného jedinca z populácie"""
-        return random.choice(self.individuals)
+        return Individual.view(self, self.rng.integers(self.size))
+
+
+class PhaseProfiler:
+    """
+    Jednoduchá inštrumentácia - sčítava čas a počet volaní pre každú fázu
+    algoritmu (a pre každý druh zvlášť)
+
+    Použitie: t = time.perf_counter(); ...; t = profiler.lap('fáza', druh, t)
+    Keď profiler nie je zapnutý, algoritmus má namiesto neho None a meranie
+    sa úplne preskočí.
+    """
+    
+    def __init__(self):
+        # (fáza, druh) -> [celkový čas, počet volaní]
+        self.records = {}
+    
+    def add(self, phase, species, elapsed, calls=1):
+        """Pripočíta čas k fáze daného druhu (species=None = celý algoritmus)"""
+        record = self.records.get((phase, species))
+        if record is None:
+            self.records[(phase, species)] = [elapsed, calls]
+        else:
+            record[0] += elapsed
+            record[1] += calls
+    
+    def lap(self, phase, species, start):
+        """Pripočíta čas od `start` po teraz a vráti aktuálny čas"""
+        now = time.perf_counter()
+        self.add(phase, species, now - start)
+        return now
+    
+    def merge(self, records):
+        """Pripočíta záznamy z iného profilera (napr. z procesu v poole)"""
+        for (phase, species), (elapsed, calls) in records.items():
+            self.add(phase, species, elapsed, calls)
+    
+    def summary(self):
+        """
+        Súhrn meraní ako slovník:
+        {'phases': {fáza: {'time', 'calls'}}, 'species': {druh: {fáza: {...}}}}
+        """
+        phases = {}
+        species = {}
+        for (phase, index), (elapsed, calls) in sorted(self.records.items(), key=str):
+            total = phases.setdefault(phase, {'time': 0.0, 'calls': 0})
+            total['time'] += elapsed
+            total['calls'] += calls
+            if index is not None:
+                species.setdefault(index, {})[phase] = {'time': elapsed, 'calls': calls}
+        return {'phases': phases, 'species': species}
 
 
 class GeneticAlgorithm:
-    """Genetický algoritmus - vyvíja jednu populáciu"""
+    """
+    Genetický algoritmus - vyvíja jednu populáciu
+
+    Metóda `evolve` pracuje naraz s celou maticou génov (selekcia cez maticu
+    indexov, kríženie všetkých párov naraz, maskovaná mutácia s `np.clip`).
+    Metódy `selection`, `crossover` a `mutation` ostávajú pre spätnú
+    kompatibilitu a pracujú s objektmi `Individual`.
+    """
     
-    def __init__(self, population, mutation_rate=0.1, crossover_rate=0.8):
+    def __init__(self, population, mutation_rate=0.1, crossover_rate=0.8, rng=None):
         self.population = population
+        # Generátor náhodných čísel (predvolene ten istý ako má populácia)
+        self.rng = rng if rng is not None else population.rng
+        # Voliteľné meranie času fáz (PhaseProfiler) a index druhu pre záznamy
+        self.profiler = None
+        self.species_index = None
         # Pravdepodobnosť, že sa gén zmení (mutácia)
         self.mutation_rate = mutation_rate
         # Pravdepodobnosť, že sa dvaja rodičia skrížia
         self.crossover_rate = crossover_rate
     
+    @property
+    def tournament_size(self):
+        """Veľkosť turnaja (10% populácie, minimálne 2)"""
+        return max(2, int(self.population.size * 0.1))
+    
+    @property
+    def mutation_strength(self):
+        """O koľko mutujeme (10% z rozsahu hraníc)"""
+        return (self.population.bounds[1] - self.population.bounds[0]) * 0.1
+    
+    def select_indices(self):
+        """
+        Turnajová selekcia nad celou populáciou naraz
+
+        Vráti vektor indexov víťazov (jeden turnaj pre každé miesto v novej
+        populácii). Účastníci turnaja sa losujú s opakovaním.
+        """
+        size = self.population.size
+        # Matica účastníkov: riadok = jeden turnaj
+        tournaments = self.rng.integers(0, size, (size, self.tournament_size))
+        # Víťaz turnaja = účastník s najväčšou fitness
+        winners = np.argmax(self.population.fitness[tournaments], axis=1)
+        return tournaments[np.arange(size), winners]
+    
+    def crossover_batch(self, parents):
+        """
+        Kríženie všetkých párov naraz (riadky 0-1, 2-3, ...)
+
+        parents: matica rodičov tvaru (n, dimension)
+        Vráti novú maticu potomkov rovnakého tvaru. Nepárový posledný
+        rodič sa len skopíruje.
+        """
+        offspring = parents.copy()
+        num_pairs = len(parents) // 2
+        if num_pairs == 0:
+            return offspring
+        
+        first = parents[0:2 * num_pairs:2]
+        second = parents[1:2 * num_pairs:2]
+        
+        # Ktoré páry sa skrížia a s akým pomerom
+        crossed = self.rng.random(num_pairs) <= self.crossover_rate
+        alpha = self.rng.random((num_pairs, 1))
+        
+        # Pre nekrížené páry použijeme alpha = 1 (potomkovia = kópie rodičov)
+        alpha = np.where(crossed[:, None], alpha, 1.0)
+        
+        offspring[0:2 * num_pairs:2] = alpha * first + (1 - alpha) * second
+        offspring[1:2 * num_pairs:2] = (1 - alpha) * first + alpha * second
+        return offspring
+    
+    def mutate_batch(self, genes):
+        """Maskovaná gaussovská mutácia celej matice génov (na mieste)"""
+        mask = self.rng.random(genes.shape) < self.mutation_rate
+        noise = self.rng.normal(0, self.mutation_strength, genes.shape)
+        genes += mask * noise
+        # Uistíme sa, že hodnoty sú stále v hraniciach
+        np.clip(genes, self.population.bounds[0], self.population.bounds[1],
+                out=genes)
+        return genes
+    
     def selection(self):
         """Turnajová selekcia - vyberie najlepších jedincov"""
-        # Veľkosť turnaja (10% populácie, minimálne 2)
-        tournament_size = max(2, int(self.population.size * 0.1))
-        selected = []
-        
-        # Pre každého jedinca v novej populácii
-        for i in range(self.population.size):
-            # Vyberieme náhodných jedincov do turnaja
-            tournament = random.sample(
-                self.population.individuals, 
-                tournament_size
-            )
-            # Vyberieme víťaza turnaja (najlepšieho)
-            winner = tournament[0]
-            for ind in tournament:
-                if ind.fitness > winner.fitness:
-                    winner = ind
-            # Pridáme víťaza do vybraných
-            selected.append(winner.copy())
-        
-        return selected
+        indices = self.select_indices()
+        return [
+            Individual(self.population.genes[i].copy(),
+                       float(self.population.fitness[i]))
+            for i in indices
+        ]
     
     def crossover(self, parent1, parent2):
         """Kríženie - vytvorí dvoch potomkov z dvoch rodičov"""
         # Niekedy sa nekrížime, len vrátime rodičov
-        if random.random() > self.crossover_rate:
+        if self.rng.random() > self.crossover_rate:
             return parent1.copy(), parent2.copy()
         
         # Vytvoríme nové gény kombináciou rodičovských génov
-        alpha = random.random()  # náhodné číslo medzi 0 a 1
-        
-        # Prvý potomok: kombinácia génov rodičov
+        alpha = self.rng.random()
         genes1 = alpha * parent1.genes + (1 - alpha) * parent2.genes
-        # Druhý potomok: opačná kombinácia
         genes2 = (1 - alpha) * parent1.genes + alpha * parent2.genes
-        
         return Individual(genes1), Individual(genes2)
     
     def mutation(self, individual):
         """Mutácia - náhodne zmení niektoré gény"""
-        for i in range(len(individual.genes)):
-            # S určitou pravdepodobnosťou zmeníme gén
-            if random.random() < self.mutation_rate:
-                # O koľko zmeníme (10% z rozsahu hraníc)
-                mutation_strength = (self.population.bounds[1] - self.population.bounds[0]) * 0.1
-                # Pridáme náhodnú zmenu (normálne rozdelenie)
-                individual.genes[i] += np.random.normal(0, mutation_strength)
-                # Uistíme sa, že hodnota je stále v hraniciach
-                if individual.genes[i] < self.population.bounds[0]:
-                    individual.genes[i] = self.population.bounds[0]
-                if individual.genes[i] > self.population.bounds[1]:
-                    individual.genes[i] = self.population.bounds[1]
-    
-    def evolve(self, evaluate_func):
-        """Vykoná jednu generáciu evolúcie"""
-        # 1. Selekcia - vyberieme najlepších
-        selected = self.selection()
+        genes = np.asarray(individual.genes, dtype=float)
+        self.mutate_batch(genes.reshape(1, -1))
+        individual.genes = genes
+    
+    def evolve(self, evaluate_func=None, evaluate_batch=None):
+        """
+        Vykoná jednu generáciu evolúcie
+
+        evaluate_func: funkcia, ktorá ohodnotí jedného jedinca (Individual)
+        evaluate_batch: funkcia, ktorá ohodnotí celú maticu génov (N, dimension)
+            naraz a vráti vektor N fitness hodnôt (má prednosť pred evaluate_func)
         
-        # 2. Kríženie a mutácia - vytvoríme novú generáciu
-        new_population = []
-        for i in range(0, len(selected), 2):
-            if i + 1 < len(selected):
-                # Máme pár rodičov - vytvoríme potomkov
-                child1, child2 = self.crossover(selected[i], selected[i + 1])
-            else:
-                # Nemáme pár - len skopírujeme
-                child1 = selected[i].copy()
-                child2 = selected[i].copy()
-            
-            # Mutácia potomkov
-            self.mutation(child1)
-            self.mutation(child2)
-            
-            # Pridáme do novej populácie
-            new_population.append(child1)
-            new_population.append(child2)
+        Ak je nastavený profiler, meria sa selekcia, variácia (kríženie
+        a mutácia) a nahradenie; čas evaluácie meria volajúci.
+        """
+        population = self.population
+        profiler = self.profiler
+        if profiler is not None:
+            t = time.perf_counter()
+        
+        # Elita z predchádzajúcej generácie (pre elitizmus)
+        elite = population.get_elite()
+        elite_genes = population.genes[elite]
+        elite_fitness = population.fitness[elite]
         
-        # Zmenšiť na pôvodnú veľkosť (ak sme vytvorili viac)
-        new_population = new_population[:self.population.size]
+        # 1. Selekcia - vyberieme najlepších (matica rodičov)
+        parents = population.genes[self.select_indices()]
+        if profiler is not None:
+            t = profiler.lap('selection', self.species_index, t)
+        
+        # 2. Kríženie a mutácia - vytvoríme novú generáciu
+        offspring = self.crossover_batch(parents)
+        self.mutate_batch(offspring)
+        if profiler is not None:
+            t = profiler.lap('variation', self.species_index, t)
         
         # 3. Evaluácia - ohodnotíme každého jedinca
-        for individual in new_population:
-            individual.fitness = evaluate_func(individual)
+        if evaluate_batch is not None:
+            fitness = np.asarray(evaluate_batch(offspring), dtype=float)
+        else:
+            fitness = np.empty(population.size)
+            for k in range(population.size):
+                fitness[k] = evaluate_func(Individual(offspring[k]))
+        if profiler is not None:
+            t = time.perf_counter()
         
         # 4. Nahradenie populácie
-        self.population.individuals = new_population
+        population.set_arrays(offspring, fitness)
         
-        # 5. Elitizmus - zachováme najlepšieho z predchádzajúcej generácie
-        best_old = self.population.get_best()
-        worst_new = new_population[0]
-        for ind in new_population:
-            if ind.fitness < worst_new.fitness:
-                worst_new = ind
-        
-        # Ak bol najlepší z predchádzajúcej generácie lepší, zachováme ho
-        if best_old.fitness > worst_new.fitness:
-            worst_new.genes = best_old.genes.copy()
-            worst_new.fitness = best_old.fitness
+        # 5. Elitizmus - každý člen starej elity nahradí jedného z najhorších
+        # potomkov, ak je od neho lepší
+        k = len(elite)
+        worst_new = np.argpartition(population.fitness, k - 1)[:k]
+        worst_new = worst_new[np.argsort(population.fitness[worst_new])]
+        replace = elite_fitness > population.fitness[worst_new]
+        if np.any(replace):
+            population.genes[worst_new[replace]] = elite_genes[replace]
+            population.assign_fitness(elite_fitness[replace], worst_new[replace])
+        if profiler is not None:
+            profiler.lap('replacement', self.species_index, t)
+
+
+class EvaluationCache:
+    """
+    Cache fitness hodnôt kompletných riešení s LRU vyhadzovaním
+
+    Kľúčom je hash bajtov vektora riešenia, takže rovnaké riešenie sa
+    nehodnotí dvakrát. Keď je cache plná, vyhodí sa najdlhšie nepoužitá
+    položka. Počítadlá hits/misses ukazujú, koľko evaluácií sa ušetrilo.
+    """
+    
+    def __init__(self, max_size):
+        # Maximálny počet uložených riešení
+        self.max_size = max_size
+        # Kľúč -> fitness, poradie = od najdlhšie nepoužitého
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @staticmethod
+    def key(solution):
+        """Kľúč riešenia - hash jeho bajtov"""
+        data = np.ascontiguousarray(solution, dtype=float).tobytes()
+        return hashlib.blake2b(data, digest_size=16).digest()
+    
+    def get(self, key):
+        """Vráti fitness pre kľúč alebo None (a započíta hit/miss)"""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        """Uloží fitness pre kľúč, pri plnej cache vyhodí najstaršiu položku"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def stats(self):
+        """Počítadlá cache ako slovník"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
 
 
 class CooperativeCoevolution:
@@ -188,7 +494,31 @@ class CooperativeCoevolution:
         generations=100,
         mutation_rate=0.1,
         crossover_rate=0.8,
-        collaboration_size=1
+        collaboration_size=1,
+        elite_size=1,
+        delta_evaluation=None,
+        verbose=True,
+        update_mode='sequential',
+        species_workers=1,
+        cache_size=0,
+        max_evaluations=None,
+        time_limit=None,
+        target_fitness=None,
+        stagnation_generations=None,
+        stagnation_tolerance=0.0,
+        seed=None,
+        history_every=1,
+        history_file=None,
+        checkpoint_file=None,
+        checkpoint_every=0,
+        profile=False,
+        groups=None,
+        grouping_cache=None,
+        grouping_options=None,
+        regroup_every=0,
+        allocation='uniform',
+        allocation_floor=0.1,
+        contribution_decay=0.5
     ):
         """
         Parametre:
@@ -201,8 +531,104 @@ class CooperativeCoevolution:
         - mutation_rate: pravdepodobnosť mutácie
         - crossover_rate: pravdepodobnosť kríženia
         - collaboration_size: koľko partnerov použijeme pri hodnotení (1 = najlepší, >1 = náhodný)
+        - elite_size: koľko najlepších jedincov každej populácie prežije do ďalšej generácie
+        - delta_evaluation: inkrementálna evaluácia po blokoch (None = automaticky,
+          ak ju problém podporuje a collaboration_size == 1)
+        - verbose: či vypisovať pokrok každých 10 generácií
+        - update_mode: 'sequential' = druhy sa vyvíjajú po rade a každý vidí
+          nových najlepších predchádzajúcich druhov; 'synchronous' = všetky
+          druhy sa vyvíjajú proti rovnakému (zmrazenému) kontextu z
+          predchádzajúcej generácie a kontext sa zlúči až na konci generácie
+        - species_workers: v synchrónnom režime počet procesov, v ktorých sa
+          druhy vyvíjajú súčasne (1 = postupne v tomto procese)
+        - cache_size: koľko ohodnotených kompletných riešení si pamätať
+          (LRU cache, 0 = cache vypnutá). Delta evaluácia cache nepoužíva.
+        
+        Kritériá ukončenia (None = nepoužiť; beh vždy skončí po `generations`):
+        - max_evaluations: maximálny počet evaluácií fitness funkcie
+          (kontroluje sa po každom druhu, v synchrónnom režime s procesmi sa
+          spustí len toľko druhov, koľko sa zmestí do zvyšku rozpočtu; môže
+          sa prekročiť najviac o jednu populáciu). Musí pokryť aspoň
+          počiatočné ohodnotenie všetkých populácií (num_species *
+          population_size), inak ValueError.
+        - time_limit: maximálny čas behu v sekundách
+        - target_fitness: ukončí beh, keď najlepšia fitness dosiahne túto hodnotu
+          (napr. -get_optimal_value_rastrigin(d) - 1e-8)
+        - stagnation_generations: ukončí beh, ak sa najlepšia fitness nezlepšila
+          o viac ako stagnation_tolerance počas toľkých generácií
+        Dôvod ukončenia je po behu v atribúte `termination_reason`.
+        
+        - seed: seed pre reprodukovateľný beh (int, np.random.SeedSequence
+          alebo None = náhodný). Cez SeedSequence.spawn sa z neho odvodí
+          nezávislý np.random.Generator pre každý druh - ten používa populácia,
+          jej genetický algoritmus aj výber náhodných spolupracovníkov.
+        
+        História (fitness história je vždy kompaktné pole float64):
+        - history_every: najlepšie riešenie sa uloží každých toľko generácií
+          (0 = ukladanie riešení vypnuté)
+        - history_file: cesta k .npy súboru - riešenia sa namiesto pamäte
+          priebežne zapisujú do súboru mapovaného do pamäte (np.memmap)
+        
+        Checkpointy (pokračovanie cez CooperativeCoevolution.resume):
+        - checkpoint_file: cesta k .npz súboru so stavom behu
+        - checkpoint_every: checkpoint sa uloží každých toľko generácií (0 = nikdy)
+        
+        - profile: meranie času a počtu volaní jednotlivých fáz (selekcia,
+          variácia, nahradenie, výber spolupracovníkov, evaluácia, zostavenie
+          najlepšieho riešenia) pre každý druh; súhrn vráti profile_summary()
+        
+        Rozdelenie premenných medzi druhy:
+        - groups: None = súvislé bloky rovnakej veľkosti podľa num_species;
+          zoznam polí indexov = druh i optimalizuje premenné groups[i]
+          (ľubovoľné, aj nesúvislé; spolu musia pokryť každú premennú práve
+          raz, num_species sa potom ignoruje); 'auto' = skupiny nájde
+          rekurzívne diferenciálne zoskupovanie (decomposition.get_grouping),
+          jeho evaluácie sa pripočítajú k evaluations
+        - grouping_cache: adresár, do ktorého sa zoskupenie pri groups='auto'
+          uloží a pri ďalšom behu s tým istým problémom načíta
+        - grouping_options: ďalšie parametre pre decomposition.differential_grouping
+          (napr. {'max_evaluations': 20000, 'separable_group_size': 50}); bez
+          max_evaluations sa pri zadanom rozpočte behu zisťovanie interakcií
+          obmedzí na GROUPING_BUDGET_SHARE (polovicu) rozpočtu; ak po ňom
+          nezostane na počiatočné ohodnotenie a jednu generáciu, ValueError
+        - regroup_every: náhodné preskupovanie - každých toľko generácií sa
+          premenné náhodne znova rozdelia medzi druhy (veľkosti skupín ostanú),
+          gény populácií sa presunú na nové miesta a populácie sa znova
+          ohodnotia (0 = vypnuté)
+        
+        Prideľovanie evolučných krokov druhom (len v režime 'sequential'):
+        - allocation: 'uniform' = každý druh raz za generáciu; 'contribution' =
+          generácia má stále num_species krokov, ale viac ich dostanú druhy,
+          ktoré najviac zlepšujú fitness kontextu (po každom kroku sa kontext
+          raz ohodnotí)
+        - allocation_floor: časť krokov, ktorá sa delí rovnomerne medzi všetky
+          druhy (aby ani "skonvergovaný" druh nebol úplne vynechaný)
+        - contribution_decay: ako rýchlo sa zabúdajú staré zlepšenia
+          (príspevok = decay * príspevok + (1 - decay) * zlepšenie)
+        
+        Ak má fitness_function atribút `fitness_batch` (funkcia, ktorá prijme
+        maticu riešení (N, dimensions) a vráti vektor N hodnôt), celá
+        populácia druhu sa ohodnotí jedným volaním. Inak sa fitness_function
+        volá pre každý riadok zvlášť.
+        
+        Ak má fitness_function atribúty `block_contribution(context, indices,
+        block_genes)` a `combine(total)` (aditívne separovateľný problém),
+        príspevok spolupracovníkov sa uloží do cache a kandidát sa ohodnotí
+        ako combine(príspevok_ostatných + príspevok_bloku). Cena evaluácie je
+        potom úmerná veľkosti bloku druhu, nie celej dimenzii.
+        
+        Ak je fitness_function korutina (async def), obalí sa do
+        evaluators.AsyncEvaluator a potomkovia druhu sa hodnotia súčasne.
+        Limit súčasných volaní a časový limit sa nastavia tak, že sa
+        namiesto korutiny odovzdá priamo AsyncEvaluator(korutina, ...).
         """
+        # Evaluátor vytvorený tu patrí algoritmu - run() ho na konci zatvorí
+        self._own_evaluator = None
+        if inspect.iscoroutinefunction(fitness_function):
+            fitness_function = self._own_evaluator = AsyncEvaluator(fitness_function)
         self.fitness_function = fitness_function
+        # Dávková (vektorizovaná) verzia fitness funkcie, ak ju problém má
+        self.fitness_batch = getattr(fitness_function, 'fitness_batch', None)
         self.dimensions = dimensions
         self.bounds = bounds
         self.num_species = num_species
@@ -211,25 +637,232 @@ class CooperativeCoevolution:
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.collaboration_size = collaboration_size
+        self.elite_size = elite_size
+        
+        # Inkrementálna (delta) evaluácia - len s najlepšími spolupracovníkmi
+        delta_available = (
+            hasattr(fitness_function, 'block_contribution')
+            and hasattr(fitness_function, 'combine')
+        )
+        if delta_evaluation is None:
+            delta_evaluation = delta_available and collaboration_size == 1
+        elif delta_evaluation and not delta_available:
+            raise ValueError("fitness_function nepodporuje delta evaluáciu "
+                             "(chýba block_contribution alebo combine)")
+        elif delta_evaluation and collaboration_size != 1:
+            raise ValueError("delta evaluácia vyžaduje collaboration_size == 1")
+        self.delta_evaluation = delta_evaluation
+        self.verbose = verbose
         
-        # Rozdelíme dimenzie medzi druhy (napr. 30 dimenzií / 4 druhy = 7-8 dimenzií na druh)
-        self.dimensions_per_species = self._split_dimensions()
+        if update_mode not in ('sequential', 'synchronous'):
+            raise ValueError(f"Neznámy update_mode: {update_mode!r}")
+        if species_workers > 1 and update_mode != 'synchronous':
+            raise ValueError("species_workers > 1 vyžaduje update_mode='synchronous'")
+        self.update_mode = update_mode
+        self.species_workers = species_workers
+        
+        if allocation not in ('uniform', 'contribution'):
+            raise ValueError(f"Neznáma allocation: {allocation!r}")
+        if allocation == 'contribution' and update_mode != 'sequential':
+            raise ValueError("allocation='contribution' vyžaduje update_mode='sequential'")
+        if not 0.0 <= allocation_floor <= 1.0:
+            raise ValueError("allocation_floor musí byť v intervale [0, 1]")
+        self.allocation = allocation
+        self.allocation_floor = allocation_floor
+        self.contribution_decay = contribution_decay
+        # Pool procesov pre synchrónny režim (vytvorí sa len počas run())
+        self._executor = None
+        # Zmrazené gény populácií pre náhodných spolupracovníkov v synchrónnom režime
+        self._frozen_genes = None
+        
+        # Cache fitness hodnôt kompletných riešení
+        self.cache_size = cache_size
+        self.cache = EvaluationCache(cache_size) if cache_size > 0 else None
+        
+        # Kritériá ukončenia
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+        self.target_fitness = target_fitness
+        self.stagnation_generations = stagnation_generations
+        self.stagnation_tolerance = stagnation_tolerance
+        
+        # Počítadlá behu
+        self.evaluations = 0            # koľkokrát sme hodnotili riešenie
+        self.generations_completed = 0  # koľko generácií prebehlo
+        self.elapsed_time = 0.0         # čas behu v sekundách
+        self.termination_reason = None  # prečo sa beh skončil
+        self._deadline = None
+        self._start_time = None
+        # Stav kritéria stagnácie
+        self._best_seen = -np.inf
+        self._stagnant_generations = 0
+        
+        # Automatické zoskupenie premenných (evaluácie sa rátajú do rozpočtu)
+        if isinstance(groups, str):
+            if groups != 'auto':
+                raise ValueError(f"Neznáme groups: {groups!r}")
+            options = dict(grouping_options or {})
+            if max_evaluations is not None and options.get('max_evaluations') is None:
+                options['max_evaluations'] = int(max_evaluations * GROUPING_BUDGET_SHARE)
+            grouping = get_grouping(fitness_function, dimensions, bounds,
+                                    cache_dir=grouping_cache, **options)
+            groups = grouping['groups']
+            self.evaluations += grouping['evaluations']
+        
+        if groups is None:
+            # Rozdelíme dimenzie medzi druhy (napr. 30 dimenzií / 4 druhy = 7-8 dimenzií na druh)
+            self.groups = None
+            self.dimensions_per_species = self._split_dimensions()
+            offsets = np.concatenate(([0], np.cumsum(self.dimensions_per_species)))
+            self.species_indices = [
+                np.arange(offsets[i], offsets[i + 1]) for i in range(self.num_species)
+            ]
+        else:
+            self.groups = self._check_groups(groups)
+            self.num_species = num_species = len(self.groups)
+            self.dimensions_per_species = [len(g) for g in self.groups]
+            self.species_indices = self.groups
+        
+        # Rozpočet musí pokryť aspoň počiatočné ohodnotenie všetkých populácií
+        # (to sa nedá prerušiť, inak by sa rozpočet prekročil o viac populácií);
+        # po automatickom zoskupení aj jednu generáciu
+        if max_evaluations is not None:
+            initial = num_species * population_size
+            required = initial if self.evaluations == 0 else 2 * initial
+            if max_evaluations - self.evaluations < required:
+                raise ValueError(
+                    f"max_evaluations={max_evaluations} nestačí ani na počiatočné "
+                    f"ohodnotenie populácií ({initial} evaluácií"
+                    f"{f' + generácia + {self.evaluations} na zoskupenie' if self.evaluations else ''})"
+                )
+        
+        # Miesto druhu vo vektore riešenia: súvislý blok ako slice (pohľad
+        # bez kopírovania), nesúvislá skupina ako pole indexov
+        self.species_slices = [
+            _as_slice(indices) for indices in self.species_indices
+        ]
+        
+        # Nezávislé prúdy náhodných čísel pre každý druh
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.species_rngs = [
+            np.random.default_rng(child)
+            for child in self.seed_sequence.spawn(num_species)
+        ]
+        
+        # Náhodné preskupovanie premenných má vlastný prúd náhodných čísel
+        # (vytvorí sa po prúdoch druhov, takže ich seedovanie nemení; používa
+        # ho aj ručné volanie regroup())
+        if regroup_every < 0:
+            raise ValueError("regroup_every musí byť nezáporný")
+        self.regroup_every = regroup_every
+        self.grouping_rng = np.random.default_rng(self.seed_sequence.spawn(1)[0])
         
         # Vytvoríme populácie pre každý druh
         self.populations = []
         self.genetic_algorithms = []
         
-        for dims in self.dimensions_per_species:
+        for dims, rng in zip(self.dimensions_per_species, self.species_rngs):
             # Vytvoríme populáciu pre tento druh
-            pop = Population(population_size, dims, bounds)
+            pop = Population(population_size, dims, bounds, elite_size, rng)
             # Vytvoríme genetický algoritmus pre túto populáciu
-            ga = GeneticAlgorithm(pop, mutation_rate, crossover_rate)
+            ga = GeneticAlgorithm(pop, mutation_rate, crossover_rate, rng)
+            ga.species_index = len(self.populations)
             self.populations.append(pop)
             self.genetic_algorithms.append(ga)
         
+        # Stav prideľovania krokov podľa príspevku: priemerné zlepšenie
+        # kontextu od každého druhu, nevyčerpané "kredity" krokov, počet
+        # vykonaných krokov a fitness kontextu (None = treba ohodnotiť)
+        self.contributions = np.zeros(num_species)
+        self._allocation_credit = np.zeros(num_species)
+        self.allocation_counts = np.zeros(num_species, dtype=np.int64)
+        self._context_fitness = None
+        
+        # Meranie času fáz (None = vypnuté, bez réžie)
+        self.profiler = PhaseProfiler() if profile else None
+        for ga in self.genetic_algorithms:
+            ga.profiler = self.profiler
+        
+        # Kontextový vektor = aktuálni najlepší spolupracovníci zo všetkých
+        # druhov. Existuje počas celého behu a mení sa len po blokoch.
+        self.context = np.empty(dimensions)
+        # Cache pre delta evaluáciu: súčet príspevkov celého kontextu a
+        # príspevky "všetkého okrem druhu i" (None = treba prepočítať)
+        self._context_total = None
+        self._rest_contribution = [None] * self.num_species
+        for i in range(self.num_species):
+            self.context[self.species_slices[i]] = self.populations[i].get_best().genes
+        # Pomocný vektor pre evaluáciu s náhodnými spolupracovníkmi
+        self._scratch = np.empty(dimensions)
+        
         # História pre sledovanie vývoja
-        self.best_fitness_history = []
-        self.best_solution_history = []
+        self.history_every = history_every
+        self.history_file = history_file
+        # Najlepšia fitness v každej generácii (predalokované pole)
+        self._fitness_history = np.empty(generations)
+        # Uložené najlepšie riešenia (zoznam v pamäti alebo np.memmap)
+        self._solution_history = []
+        # Čísla generácií, v ktorých sme riešenie uložili
+        self.solution_history_generations = []
+        
+        # Checkpointy
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_every = checkpoint_every
+        # True = stav bol načítaný z checkpointu a run() má pokračovať
+        self._resumed = False
+    
+    @property
+    def best_fitness_history(self):
+        """Najlepšia fitness po každej dokončenej generácii (np.ndarray)"""
+        return self._fitness_history[:self.generations_completed]
+    
+    @property
+    def best_solution_history(self):
+        """Uložené najlepšie riešenia (podľa history_every a history_file)"""
+        return self._solution_history[:len(self.solution_history_generations)]
+    
+    def _open_history(self):
+        """Pripraví úložisko histórie riešení pred behom"""
+        if self.history_file is None or self.history_every <= 0:
+            return
+        # Súbor má miesto pre všetky záznamy, na konci behu sa skráti
+        max_records = max(1, self.generations // self.history_every)
+        records = len(self.solution_history_generations)
+        previous = None
+        if self._resumed and records > 0:
+            # Pri pokračovaní zachováme záznamy, ktoré už sú v súbore
+            previous = np.array(np.load(self.history_file, mmap_mode='r')[:records])
+        self._solution_history = np.lib.format.open_memmap(
+            self.history_file, mode='w+', dtype=np.float64,
+            shape=(max_records, self.dimensions)
+        )
+        if previous is not None:
+            self._solution_history[:records] = previous
+    
+    def _record_history(self, generation, best_solution, best_fitness):
+        """Zaznamená výsledok generácie (generation je číslovaná od 1)"""
+        self._fitness_history[generation - 1] = best_fitness
+        if self.history_every <= 0 or generation % self.history_every != 0:
+            return
+        if isinstance(self._solution_history, np.memmap):
+            self._solution_history[len(self.solution_history_generations)] = best_solution
+        else:
+            self._solution_history.append(best_solution.copy())
+        self.solution_history_generations.append(generation)
+    
+    def _close_history(self):
+        """Zapíše históriu na disk a skráti súbor na skutočný počet záznamov"""
+        if not isinstance(self._solution_history, np.memmap):
+            return
+        records = len(self.solution_history_generations)
+        self._solution_history.flush()
+        self._solution_history = None
+        _truncate_npy(self.history_file, records)
+        # Pre ďalšie čítanie súbor otvoríme len na čítanie
+        self._solution_history = np.load(self.history_file, mmap_mode='r')
     
     def _split_dimensions(self):
         """Rozdelí dimenzie medzi druhy"""
@@ -246,6 +879,64 @@ class CooperativeCoevolution:
         
         return dimensions
     
+    def _check_groups(self, groups):
+        """Skontroluje, že skupiny pokrývajú každú premennú práve raz"""
+        groups = [np.asarray(g, dtype=np.int64).ravel() for g in groups]
+        if not groups or any(len(g) == 0 for g in groups):
+            raise ValueError("groups musí obsahovať aspoň jednu neprázdnu skupinu")
+        counts = np.bincount(np.concatenate(groups), minlength=self.dimensions)
+        if (len(counts) != self.dimensions or np.any(counts != 1)
+                or min(g.min() for g in groups) < 0):
+            raise ValueError("groups musia pokryť každú z dimenzií práve raz")
+        return groups
+    
+    def regroup(self, groups=None):
+        """
+        Znova rozdelí premenné medzi druhy
+
+        groups: nové skupiny indexov (rovnaké veľkosti ako doteraz);
+        None = náhodná permutácia premenných rozdelená na skupiny
+        doterajších veľkostí.
+
+        Gény sa presunú bez vytvárania nových populácií: k-ty najlepší
+        jedinci všetkých druhov spolu tvoria k-te kompletné riešenie (prvé je
+        kontext) a z neho si každý druh vezme premenné svojej novej skupiny.
+        Fitness hodnoty tým prestanú platiť, preto sa populácie znova ohodnotia.
+        """
+        if groups is None:
+            permutation = self.grouping_rng.permutation(self.dimensions)
+            bounds = np.cumsum(self.dimensions_per_species)[:-1]
+            groups = np.split(permutation, bounds)
+        groups = self._check_groups(groups)
+        if [len(g) for g in groups] != list(self.dimensions_per_species):
+            raise ValueError("nové skupiny musia mať rovnaké veľkosti ako doterajšie")
+        
+        profiler = self.profiler
+        if profiler is not None:
+            t = time.perf_counter()
+        
+        # Kompletné riešenia z k-tych najlepších jedincov všetkých druhov
+        solutions = np.empty((self.population_size, self.dimensions))
+        for i, pop in enumerate(self.populations):
+            order = np.argsort(-pop.fitness, kind='stable')
+            solutions[:, self.species_slices[i]] = pop.genes[order]
+        
+        self.groups = groups
+        self.species_indices = groups
+        self.species_slices = [_as_slice(indices) for indices in groups]
+        for i, pop in enumerate(self.populations):
+            pop.genes[:] = solutions[:, self.species_slices[i]]
+        # Príspevky pre delta evaluáciu patria k starým skupinám
+        self._context_total = None
+        self._context_fitness = None
+        self._rest_contribution = [None] * self.num_species
+        if profiler is not None:
+            profiler.lap('regrouping', None, t)
+        
+        # Kontext (prvé riešenie) sa nezmenil, populácie ohodnotíme proti nemu
+        for i in range(self.num_species):
+            self._evaluate_population(i)
+    
     def _evaluate_individual(self, species_index, individual, collaborators=None):
         """
         Ohodnotí jedinca - musí spolupracovať s jedincami z iných druhov
@@ -254,6 +945,22 @@ class CooperativeCoevolution:
         individual: jedinec, ktorého hodnotíme
         collaborators: spolupracovníci z iných druhov (ak nie je zadaný, vyberieme náhodne)
         """
+        block = self.species_slices[species_index]
+        
+        if collaborators is None and self.delta_evaluation:
+            genes = np.asarray(individual.genes).reshape(1, -1)
+            return float(self._evaluate_block(species_index, genes)[0])
+        
+        if collaborators is None and self.collaboration_size == 1:
+            # Najlepší spolupracovníci už sú v kontextovom vektore - len
+            # dočasne prepíšeme blok nášho druhu a po evaluácii ho vrátime
+            saved = self.context[block].copy()
+            self.context[block] = individual.genes
+            try:
+                return self._evaluate_solution(self.context)
+            finally:
+                self.context[block] = saved
+        
         # Ak nemáme spolupracovníkov, vyberieme ich
         if collaborators is None:
             collaborators = []
@@ -261,101 +968,645 @@ class CooperativeCoevolution:
                 if i == species_index:
                     continue  # Preskočíme náš vlastný druh
                 
-                if self.collaboration_size == 1:
-                    # Použijeme najlepšieho z každej populácie
-                    collaborators.append([pop.get_best()])
-                else:
-                    # Vyberieme náhodných spolupracovníkov
-                    collab_list = []
-                    for j in range(self.collaboration_size):
-                        collab_list.append(pop.get_random_individual())
-                    collaborators.append(collab_list)
-        
-        # Zostavíme kompletný vektor riešenia (všetky dimenzie)
-        solution = np.zeros(self.dimensions)
-        
-        # Vložíme gény aktuálneho jedinca na správne miesto
-        start_idx = 0
-        for i in range(species_index):
-            start_idx += self.dimensions_per_species[i]
-        end_idx = start_idx + self.dimensions_per_species[species_index]
-        solution[start_idx:end_idx] = individual.genes
+                # Vyberieme náhodných spolupracovníkov
+                collab_list = []
+                for j in range(self.collaboration_size):
+                    collab_list.append(pop.get_random_individual())
+                collaborators.append(collab_list)
+        
+        # Zostavíme riešenie v pomocnom vektore (kontext ostane nezmenený)
+        solution = self._scratch
+        solution[self.species_slices[species_index]] = individual.genes
         
         # Vložíme gény spolupracovníkov z iných druhov
         collab_idx = 0
-        for i, pop in enumerate(self.populations):
+        for i in range(self.num_species):
             if i == species_index:
                 continue  # Preskočíme náš vlastný druh
             
-            # Nájdeme správne miesto pre tento druh
-            start_idx = 0
-            for j in range(i):
-                start_idx += self.dimensions_per_species[j]
-            end_idx = start_idx + self.dimensions_per_species[i]
-            
             # Vyberieme jedného spolupracovníka
-            if self.collaboration_size == 1:
-                partner = collaborators[collab_idx][0]
-            else:
-                partner = random.choice(collaborators[collab_idx])
+            candidates = collaborators[collab_idx]
+            partner = candidates[self.species_rngs[species_index].integers(len(candidates))]
             
             # Vložíme jeho gény
-            solution[start_idx:end_idx] = partner.genes
+            solution[self.species_slices[i]] = partner.genes
             collab_idx += 1
         
         # Ohodnotíme kompletný vektor
-        return self.fitness_function(solution)
+        return self._evaluate_solution(solution)
+    
+    def _evaluate_solution(self, solution):
+        """Ohodnotí jedno kompletné riešenie (cez cache, ak je zapnutá)"""
+        if self.cache is None:
+            self.evaluations += 1
+            return self.fitness_function(solution)
+        key = EvaluationCache.key(solution)
+        fitness = self.cache.get(key)
+        if fitness is None:
+            self.evaluations += 1
+            fitness = self.fitness_function(solution)
+            self.cache.put(key, fitness)
+        return fitness
+    
+    def _evaluate_solutions(self, solutions):
+        """
+        Ohodnotí maticu kompletných riešení (N, dimensions)
+
+        Riešenia nájdené v cache sa nehodnotia znova, ostatné sa ohodnotia
+        naraz jedným volaním _call_fitness.
+        """
+        if self.cache is None:
+            return self._call_fitness(solutions)
+        
+        fitness = np.empty(len(solutions))
+        keys = [EvaluationCache.key(x) for x in solutions]
+        missing = []
+        for k, key in enumerate(keys):
+            value = self.cache.get(key)
+            if value is None:
+                missing.append(k)
+            else:
+                fitness[k] = value
+        
+        if missing:
+            fitness[missing] = self._call_fitness(solutions[missing])
+            for k in missing:
+                self.cache.put(keys[k], float(fitness[k]))
+        return fitness
+    
+    def _call_fitness(self, solutions):
+        """
+        Zavolá fitness funkciu na maticu riešení (N, dimensions)
+
+        Použije dávkovú fitness funkciu, ak existuje, inak volá
+        fitness_function pre každý riadok.
+        """
+        self.evaluations += len(solutions)
+        if self.fitness_batch is not None:
+            return np.asarray(self.fitness_batch(solutions), dtype=float)
+        return np.array([self.fitness_function(x) for x in solutions], dtype=float)
+    
+    def _assemble_solutions(self, species_index, block_genes):
+        """
+        Zostaví maticu kompletných riešení pre gény jedného druhu
+
+        Riadok k obsahuje gény block_genes[k] na mieste druhu species_index
+        a gény spolupracovníkov na miestach ostatných druhov.
+        """
+        count = len(block_genes)
+        solutions = np.empty((count, self.dimensions))
+        
+        if self.collaboration_size == 1:
+            # Najlepší spolupracovníci sú v kontexte (rovnaký pre všetky riadky)
+            solutions[:] = self.context
+        else:
+            # Náhodný spolupracovník pre každý riadok zvlášť
+            # (v synchrónnom režime z populácií na začiatku generácie)
+            for i, pop in enumerate(self.populations):
+                if i == species_index:
+                    continue
+                genes = pop.genes if self._frozen_genes is None else self._frozen_genes[i]
+                partners = self.species_rngs[species_index].integers(0, pop.size, count)
+                solutions[:, self.species_slices[i]] = genes[partners]
+        
+        # Gény hodnotených jedincov
+        solutions[:, self.species_slices[species_index]] = block_genes
+        return solutions
+    
+    def _evaluate_block(self, species_index, block_genes):
+        """
+        Ohodnotí maticu génov jedného druhu (N, dimensions_per_species[i])
+
+        Riešenia sa skladajú a hodnotia po dávkach, aby matica (N, dimensions)
+        nezaberala viac ako MAX_BATCH_ELEMENTS čísel.
+        """
+        if self.delta_evaluation:
+            return self._evaluate_block_delta(species_index, block_genes)
+        
+        profiler = self.profiler
+        count = len(block_genes)
+        rows_per_batch = max(1, MAX_BATCH_ELEMENTS // self.dimensions)
+        fitness = np.empty(count)
+        for start in range(0, count, rows_per_batch):
+            end = min(start + rows_per_batch, count)
+            if profiler is not None:
+                t = time.perf_counter()
+            solutions = self._assemble_solutions(species_index, block_genes[start:end])
+            if profiler is not None:
+                t = profiler.lap('collaborators', species_index, t)
+            fitness[start:end] = self._evaluate_solutions(solutions)
+            if profiler is not None:
+                profiler.lap('evaluation', species_index, t)
+        return fitness
+    
+    def _evaluate_block_delta(self, species_index, block_genes):
+        """
+        Delta evaluácia: príspevok ostatných druhov (z cache) + príspevok bloku
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            t = time.perf_counter()
+        rest = self._get_rest_contribution(species_index)
+        if profiler is not None:
+            t = profiler.lap('collaborators', species_index, t)
+        
+        indices = self.species_indices[species_index]
+        self.evaluations += len(block_genes)
+        contribution = self.fitness_function.block_contribution(
+            self.context, indices, block_genes
+        )
+        fitness = np.asarray(self.fitness_function.combine(rest + contribution), dtype=float)
+        if profiler is not None:
+            profiler.lap('evaluation', species_index, t)
+        return fitness
+    
+    def _get_rest_contribution(self, species_index):
+        """Vráti (a pri potrebe prepočíta) príspevok kontextu bez druhu species_index"""
+        if self._rest_contribution[species_index] is None:
+            if self._context_total is None:
+                # Súčet príspevkov celého kontextu - raz po každej zmene kontextu
+                self._context_total = self.fitness_function.block_contribution(
+                    self.context, np.arange(self.dimensions), self.context[None]
+                )[0]
+            indices = self.species_indices[species_index]
+            own = self.fitness_function.block_contribution(
+                self.context, indices, self.context[self.species_slices[species_index]][None]
+            )[0]
+            self._rest_contribution[species_index] = self._context_total - own
+        return self._rest_contribution[species_index]
     
     def _evaluate_population(self, species_index):
         """Ohodnotí celú populáciu daného druhu"""
-        for individual in self.populations[species_index].individuals:
-            individual.fitness = self._evaluate_individual(species_index, individual)
+        pop = self.populations[species_index]
+        pop.assign_fitness(self._evaluate_block(species_index, pop.genes))
+        # Najlepší jedinec sa mohol zmeniť - obnovíme jeho blok v kontexte
+        self._update_context(species_index)
+    
+    def _update_context(self, species_index):
+        """Zapíše najlepšieho jedinca druhu do jeho bloku v kontextovom vektore"""
+        if self.profiler is not None:
+            t = time.perf_counter()
+        block = self.species_slices[species_index]
+        best_genes = self.populations[species_index].get_best().genes
+        if not np.array_equal(self.context[block], best_genes):
+            self.context[block] = best_genes
+            # Kontext sa zmenil - príspevky pre delta evaluáciu treba prepočítať
+            self._context_total = None
+            self._rest_contribution = [None] * self.num_species
+        if self.profiler is not None:
+            self.profiler.lap('collaborators', species_index, t)
     
     def _get_best_solution(self):
         """Vráti najlepšie riešenie - zostavené z najlepších jedincov z každej populácie"""
-        solution = np.zeros(self.dimensions)
-        
-        for i, pop in enumerate(self.populations):
-            # Nájdeme správne miesto pre tento druh
-            start_idx = 0
-            for j in range(i):
-                start_idx += self.dimensions_per_species[j]
-            end_idx = start_idx + self.dimensions_per_species[i]
-            
-            # Vezmeme najlepšieho jedinca z tejto populácie
-            best = pop.get_best()
-            solution[start_idx:end_idx] = best.genes
+        if self.profiler is not None:
+            t = time.perf_counter()
+        # Kontext už obsahuje najlepších jedincov, len ho pre istotu obnovíme
+        for i in range(self.num_species):
+            self._update_context(i)
         
         # Ohodnotíme toto riešenie
-        fitness = self.fitness_function(solution)
+        solution = self.context.copy()
+        fitness = self._evaluate_solution(solution)
+        if self.profiler is not None:
+            self.profiler.lap('best_solution', None, t)
         return solution, fitness
     
+    def profile_summary(self):
+        """Súhrn meraní fáz (PhaseProfiler.summary) alebo None, ak je meranie vypnuté"""
+        if self.profiler is None:
+            return None
+        return self.profiler.summary()
+    
+    def _evolve_species(self, species_index):
+        """Evoluuje populáciu jedného druhu o jednu generáciu"""
+        # Vytvoríme funkciu, ktorá hodnotí všetkých potomkov tohto druhu naraz
+        def evaluate_batch(genes):
+            return self._evaluate_block(species_index, genes)
+        
+        self.genetic_algorithms[species_index].evolve(evaluate_batch=evaluate_batch)
+    
+    def _run_generation_sequential(self):
+        """Jedna generácia - druhy sa vyvíjajú po rade (Gauss-Seidel)"""
+        for i in range(self.num_species):
+            # Evoluujeme populáciu a jej nového najlepšieho dáme do kontextu
+            self._evolve_species(i)
+            self._update_context(i)
+            # Rozpočet evaluácií alebo času sa môže minúť aj uprostred generácie
+            if self._budget_exhausted():
+                break
+    
+    def _allocation_shares(self):
+        """Podiel krokov generácie pre každý druh podľa jeho príspevku"""
+        uniform = np.full(self.num_species, 1.0 / self.num_species)
+        total = self.contributions.sum()
+        if total <= 0:
+            return uniform
+        return (self.allocation_floor * uniform
+                + (1.0 - self.allocation_floor) * self.contributions / total)
+    
+    def _run_generation_contribution(self):
+        """
+        Jedna generácia s prideľovaním krokov podľa príspevku druhov
+
+        Každý druh dostane kredit podľa svojho podielu; krok dostane vždy
+        druh s najväčším kreditom. Kredity sa prenášajú do ďalších generácií,
+        takže aj druh s malým podielom sa časom dostane na rad.
+        """
+        if self._context_fitness is None:
+            self._context_fitness = self._evaluate_solution(self.context)
+        self._allocation_credit += self._allocation_shares() * self.num_species
+        decay = self.contribution_decay
+        
+        for _ in range(self.num_species):
+            i = int(np.argmax(self._allocation_credit))
+            self._allocation_credit[i] -= 1.0
+            self._evolve_species(i)
+            self._update_context(i)
+            self.allocation_counts[i] += 1
+            
+            # Príspevok druhu = zlepšenie fitness kontextu po jeho kroku
+            if self.profiler is not None:
+                t = time.perf_counter()
+            fitness = self._evaluate_solution(self.context)
+            if self.profiler is not None:
+                self.profiler.lap('contribution', None, t)
+            improvement = max(0.0, fitness - self._context_fitness)
+            self.contributions[i] = decay * self.contributions[i] + (1.0 - decay) * improvement
+            self._context_fitness = fitness
+            
+            if self._budget_exhausted():
+                break
+    
+    def _run_generation_synchronous(self):
+        """
+        Jedna generácia - všetky druhy proti zmrazenému kontextu (Jacobi)
+
+        Kontext sa počas generácie nemení, takže druhy sú nezávislé a môžu
+        sa vyvíjať súčasne v poole procesov. Noví najlepší sa do kontextu
+        zapíšu až na konci generácie.
+        """
+        if self.collaboration_size > 1:
+            self._frozen_genes = [pop.genes.copy() for pop in self.populations]
+        
+        # Pri rozpočte evaluácií sa spustí len toľko druhov, koľko populácií
+        # sa doň ešte zmestí (krok druhu stojí najviac population_size evaluácií)
+        count = self.num_species
+        if self.max_evaluations is not None:
+            remaining = self.max_evaluations - self.evaluations
+            count = min(count, max(1, -(-remaining // self.population_size)))
+        
+        if self._executor is None:
+            for i in range(count):
+                self._evolve_species(i)
+                # Čas sa môže minúť aj uprostred generácie
+                if self._budget_exhausted():
+                    break
+        else:
+            # Stav algoritmu serializujeme raz a pošleme ho všetkým úlohám
+            payload = pickle.dumps(self._worker_state())
+            futures = [
+                self._executor.submit(_evolve_species_task, payload, i)
+                for i in range(count)
+            ]
+            for i, future in enumerate(futures):
+                genes, fitness, evaluations, rng_state, records = future.result()
+                if self.profiler is not None:
+                    self.profiler.merge(records)
+                self.populations[i].set_arrays(genes, fitness)
+                self.evaluations += evaluations
+                # Prúd náhodných čísel druhu pokračuje tam, kde skončil v procese
+                self.species_rngs[i].bit_generator.state = rng_state
+        
+        self._frozen_genes = None
+        # Zlúčenie kontextu na konci generácie
+        for i in range(self.num_species):
+            self._update_context(i)
+    
+    def _worker_state(self):
+        """Stav potrebný na evolúciu druhu v inom procese (bez poolu a histórie)"""
+        state = self.__dict__.copy()
+        for key in ('_executor', '_fitness_history', '_solution_history',
+                    'solution_history_generations', '_start_time'):
+            state.pop(key, None)
+        # Cache sa do procesov neposiela (jej zmeny by sa aj tak stratili)
+        state['cache'] = None
+        # Proces meria do vlastného prázdneho profilera, záznamy vráti
+        if self.profiler is not None:
+            state['profiler'] = PhaseProfiler()
+        return state
+    
     def run(self):
         """Spustí kooperatívny koevolučný algoritmus"""
+        if self.update_mode == 'synchronous' and self.species_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.species_workers)
+        try:
+            return self._run()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            if self._own_evaluator is not None:
+                self._own_evaluator.close()
+    
+    def _config(self):
+        """Parametre konštruktora (okrem fitness funkcie) pre checkpoint"""
+        return {
+            'dimensions': self.dimensions,
+            'bounds': [float(b) for b in self.bounds],
+            'num_species': self.num_species,
+            'population_size': self.population_size,
+            'generations': self.generations,
+            'mutation_rate': self.mutation_rate,
+            'crossover_rate': self.crossover_rate,
+            'collaboration_size': self.collaboration_size,
+            'elite_size': self.elite_size,
+            'delta_evaluation': bool(self.delta_evaluation),
+            'verbose': self.verbose,
+            'update_mode': self.update_mode,
+            'species_workers': self.species_workers,
+            'cache_size': self.cache_size,
+            'max_evaluations': self.max_evaluations,
+            'time_limit': self.time_limit,
+            'target_fitness': self.target_fitness,
+            'stagnation_generations': self.stagnation_generations,
+            'stagnation_tolerance': self.stagnation_tolerance,
+            'history_every': self.history_every,
+            'history_file': self.history_file,
+            'checkpoint_file': self.checkpoint_file,
+            'checkpoint_every': self.checkpoint_every,
+            'profile': self.profiler is not None,
+            'groups': None if self.groups is None else [g.tolist() for g in self.groups],
+            'regroup_every': self.regroup_every,
+            'allocation': self.allocation,
+            'allocation_floor': self.allocation_floor,
+            'contribution_decay': self.contribution_decay
+        }
+    
+    def save_checkpoint(self, path):
+        """
+        Uloží stav behu do .npz súboru (populácie, kontext, história, stavy
+        generátorov náhodných čísel, počítadlá a cache)
+
+        Súbor sa zapíše najprv do dočasného súboru a potom sa atomicky
+        premenuje, takže prerušenie počas zápisu nepoškodí starší checkpoint.
+        """
+        if self._start_time is not None:
+            self.elapsed_time = time.time() - self._start_time
+        
+        metadata = {
+            'config': self._config(),
+            'generations_completed': self.generations_completed,
+            'evaluations': self.evaluations,
+            'elapsed_time': self.elapsed_time,
+            'best_seen': float(self._best_seen),
+            'stagnant_generations': self._stagnant_generations,
+            'seed_entropy': self.seed_sequence.entropy,
+            'seed_spawn_key': list(self.seed_sequence.spawn_key),
+            'rng_states': [rng.bit_generator.state for rng in self.species_rngs],
+            'grouping_rng_state': self.grouping_rng.bit_generator.state,
+            'solution_history_generations': self.solution_history_generations,
+            'context_fitness': self._context_fitness,
+            'cache_hits': self.cache.hits if self.cache is not None else 0,
+            'cache_misses': self.cache.misses if self.cache is not None else 0
+        }
+        
+        arrays = {
+            'metadata': np.array(json.dumps(metadata)),
+            'context': self.context,
+            'fitness_history': self.best_fitness_history,
+            'contributions': self.contributions,
+            'allocation_credit': self._allocation_credit,
+            'allocation_counts': self.allocation_counts
+        }
+        for i, pop in enumerate(self.populations):
+            arrays[f'genes_{i}'] = pop.genes
+            arrays[f'fitness_{i}'] = pop.fitness
+            arrays[f'elite_{i}'] = pop.elite_indices
+        if self.history_file is None and self.history_every > 0:
+            arrays['solution_history'] = np.array(self.best_solution_history).reshape(-1, self.dimensions)
+        elif isinstance(self._solution_history, np.memmap):
+            self._solution_history.flush()
+        if self.cache is not None:
+            keys = list(self.cache._entries.keys())
+            arrays['cache_keys'] = np.frombuffer(b''.join(keys), dtype=np.uint8).reshape(-1, 16)
+            arrays['cache_values'] = np.array(list(self.cache._entries.values()), dtype=float)
+        
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def resume(cls, path, fitness_function, **overrides):
+        """
+        Obnoví beh z checkpointu - ďalšie volanie run() pokračuje presne tam,
+        kde sa checkpoint uložil (s rovnakými náhodnými číslami)
+
+        path: .npz súbor uložený cez save_checkpoint
+        fitness_function: tá istá fitness funkcia ako v pôvodnom behu
+        overrides: parametre, ktoré chceme zmeniť (napr. verbose, generations)
+        """
+        with np.load(path) as data:
+            metadata = json.loads(str(data['metadata']))
+            config = metadata['config']
+            config['bounds'] = tuple(config['bounds'])
+            config.update(overrides)
+            seed = np.random.SeedSequence(metadata['seed_entropy'],
+                                          spawn_key=tuple(metadata['seed_spawn_key']))
+            ccea = cls(fitness_function, seed=seed, **config)
+            
+            for i, pop in enumerate(ccea.populations):
+                pop.genes[:] = data[f'genes_{i}']
+                pop.fitness[:] = data[f'fitness_{i}']
+                pop.elite_indices = data[f'elite_{i}'].copy()
+                pop.best_index = int(pop.elite_indices[0])
+            for rng, state in zip(ccea.species_rngs, metadata['rng_states']):
+                rng.bit_generator.state = state
+            if metadata.get('grouping_rng_state') is not None:
+                ccea.grouping_rng.bit_generator.state = metadata['grouping_rng_state']
+            ccea.context[:] = data['context']
+            if 'contributions' in data:
+                ccea.contributions[:] = data['contributions']
+                ccea._allocation_credit[:] = data['allocation_credit']
+                ccea.allocation_counts[:] = data['allocation_counts']
+            
+            completed = metadata['generations_completed']
+            ccea.generations_completed = completed
+            ccea._fitness_history[:completed] = data['fitness_history']
+            ccea.solution_history_generations = metadata['solution_history_generations']
+            if 'solution_history' in data:
+                ccea._solution_history = list(data['solution_history'])
+            
+            if ccea.cache is not None and 'cache_keys' in data:
+                for key, value in zip(data['cache_keys'], data['cache_values']):
+                    ccea.cache.put(key.tobytes(), float(value))
+                ccea.cache.hits = metadata['cache_hits']
+                ccea.cache.misses = metadata['cache_misses']
+        
+        ccea.evaluations = metadata['evaluations']
+        ccea.elapsed_time = metadata['elapsed_time']
+        ccea._best_seen = metadata['best_seen']
+        ccea._stagnant_generations = metadata['stagnant_generations']
+        ccea._context_fitness = metadata.get('context_fitness')
+        ccea._resumed = True
+        return ccea
+    
+    def _budget_exhausted(self):
+        """Vráti dôvod ukončenia, ak sa minul rozpočet evaluácií alebo času"""
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+        if self._deadline is not None and time.time() >= self._deadline:
+            return 'time_limit'
+        return None
+    
+    def _check_convergence(self, best_fitness):
+        """Vráti dôvod ukončenia, ak sme dosiahli cieľ alebo stagnujeme"""
+        if self.target_fitness is not None and best_fitness >= self.target_fitness:
+            return 'target_fitness'
+        
+        if self.stagnation_generations is not None:
+            if best_fitness > self._best_seen + self.stagnation_tolerance:
+                self._best_seen = best_fitness
+                self._stagnant_generations = 0
+            else:
+                self._stagnant_generations += 1
+            if self._stagnant_generations >= self.stagnation_generations:
+                return 'stagnation'
+        return None
+    
+    def _run(self):
+        """Hlavný cyklus algoritmu (volá ho run)"""
+        resumed = self._resumed
+        # Pri pokračovaní z checkpointu sa čas počíta od pôvodného začiatku
+        start_time = time.time() - (self.elapsed_time if resumed else 0.0)
+        self._start_time = start_time
+        if self.time_limit is not None:
+            self._deadline = start_time + self.time_limit
+        self.termination_reason = None
+        self._open_history()
+        self._resumed = False
+        
         # 1. Počiatočná evaluácia - ohodnotíme všetky populácie
-        for i in range(self.num_species):
-            self._evaluate_population(i)
+        # (pri pokračovaní z checkpointu sú populácie už ohodnotené)
+        if not resumed:
+            self._best_seen = -np.inf
+            self._stagnant_generations = 0
+            self._context_fitness = None
+            for i in range(self.num_species):
+                self._evaluate_population(i)
         
         # 2. Hlavný evolučný cyklus
-        for generation in range(self.generations):
+        for generation in range(self.generations_completed, self.generations):
+            # Pred každou generáciou skontrolujeme rozpočet
+            self.termination_reason = self._budget_exhausted()
+            if self.termination_reason is not None:
+                break
+            
+            # Náhodné preskupenie premenných medzi druhmi
+            if self.regroup_every > 0 and generation > 0 and generation % self.regroup_every == 0:
+                self.regroup()
+            
             # Evoluujeme každú populáciu
-            for i in range(self.num_species):
-                # Vytvoríme funkciu, ktorá hodnotí jedinca tohto druhu
-                def evaluate_func(ind):
-                    return self._evaluate_individual(i, ind)
-                
-                # Evoluujeme populáciu
-                self.genetic_algorithms[i].evolve(evaluate_func)
+            if self.update_mode == 'synchronous':
+                self._run_generation_synchronous()
+            elif self.allocation == 'contribution':
+                self._run_generation_contribution()
+            else:
+                self._run_generation_sequential()
+            self.generations_completed = generation + 1
             
             # Zaznamenáme najlepšie riešenie
             best_solution, best_fitness = self._get_best_solution()
-            self.best_fitness_history.append(best_fitness)
-            self.best_solution_history.append(best_solution.copy())
+            self._record_history(generation + 1, best_solution, best_fitness)
             
             # Každých 10 generácií vypíšeme pokrok
-            if (generation + 1) % 10 == 0:
+            if self.verbose and (generation + 1) % 10 == 0:
                 print(f"Generácia {generation + 1}/{self.generations}, "
                       f"najlepšia fitness: {best_fitness:.6f}")
+            
+            # Dosiahli sme cieľ alebo algoritmus stagnuje?
+            self.termination_reason = self._check_convergence(best_fitness)
+            if self.termination_reason is not None:
+                break
+            
+            # Pravidelný checkpoint
+            if (self.checkpoint_file is not None and self.checkpoint_every > 0
+                    and (generation + 1) % self.checkpoint_every == 0):
+                self.save_checkpoint(self.checkpoint_file)
+        
+        if self.termination_reason is None:
+            self.termination_reason = self._budget_exhausted() or 'generations'
+        self.elapsed_time = time.time() - start_time
+        self._close_history()
+        if self.verbose and self.termination_reason != 'generations':
+            print(f"Beh ukončený po {self.generations_completed} generáciách "
+                  f"({self.termination_reason}), evaluácií: {self.evaluations}")
         
         # Vrátime najlepšie riešenie
         return self._get_best_solution()
+
+
+def _evolve_species_task(payload, species_index):
+    """
+    Evoluuje jeden druh v procese z poolu (synchrónny režim)
+
+    payload: serializovaný stav algoritmu (CooperativeCoevolution._worker_state)
+    Vráti novú maticu génov, vektor fitness populácie druhu, počet
+    vykonaných evaluácií, stav generátora náhodných čísel druhu a záznamy
+    profilera (prázdne, ak je meranie vypnuté).
+    """
+    ccea = CooperativeCoevolution.__new__(CooperativeCoevolution)
+    ccea.__dict__.update(pickle.loads(payload))
+    for ga in ccea.genetic_algorithms:
+        ga.profiler = ccea.profiler
+    
+    evaluations_before = ccea.evaluations
+    ccea._evolve_species(species_index)
+    pop = ccea.populations[species_index]
+    rng_state = ccea.species_rngs[species_index].bit_generator.state
+    records = ccea.profiler.records if ccea.profiler is not None else {}
+    return pop.genes, pop.fitness, ccea.evaluations - evaluations_before, rng_state, records
+
+
+def _as_slice(indices):
+    """Súvislé rastúce indexy prevedie na slice, inak ich vráti ako pole"""
+    if len(indices) > 0 and np.array_equal(indices, np.arange(indices[0], indices[0] + len(indices))):
+        return slice(int(indices[0]), int(indices[0]) + len(indices))
+    return indices
+
+
+def _truncate_npy(path, rows):
+    """
+    Skráti .npy súbor s 2D poľom na prvých `rows` riadkov (na mieste)
+
+    Prepíše hlavičku s novým tvarom a odreže zvyšok súboru. Ak by nová
+    hlavička mala inú dĺžku, súbor sa nechá tak (riadky navyše sú nuly).
+    """
+    headers = {
+        (1, 0): (np.lib.format.read_array_header_1_0, np.lib.format.write_array_header_1_0),
+        (2, 0): (np.lib.format.read_array_header_2_0, np.lib.format.write_array_header_2_0),
+    }
+    with open(path, 'r+b') as f:
+        version = np.lib.format.read_magic(f)
+        if version not in headers:
+            return
+        read_header, write_header = headers[version]
+        shape, fortran_order, dtype = read_header(f)
+        header_length = f.tell()
+        if rows >= shape[0]:
+            return
+        
+        header = {
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': fortran_order,
+            'shape': (rows,) + tuple(shape[1:])
+        }
+        f.seek(0)
+        write_header(f, header)
+        if f.tell() != header_length:
+            # Hlavička by sa posunula - vrátime pôvodnú
+            f.seek(0)
+            header['shape'] = shape
+            write_header(f, header)
+            return
+        f.truncate(header_length + rows * int(np.prod(shape[1:])) * dtype.itemsize)
@@ -0,0 +1,260 @@
+"""
+Automatická dekompozícia premenných pre kooperatívnu koevolúciu
+
+Rekurzívne diferenciálne zoskupovanie (RDG, Sun a kol. 2017) zistí, ktoré
+premenné problému sa navzájom ovplyvňujú, a rozdelí ich do skupín - každú
+skupinu potom rieši jeden druh. Premenné a a b interagujú, ak zmena a mení
+efekt zmeny b:
+
+    (f(x) - f(x + da)) != (f(x + db) - f(x + da + db))
+
+Namiesto dvojíc premenných sa testujú celé množiny a interagujúca množina
+sa rekurzívne delí na polovice, takže počet evaluácií je rádovo
+O(n log n) namiesto O(n^2) pri pôvodnom diferenciálnom zoskupovaní.
+
+Nájdené zoskupenie sa dá uložiť na disk (JSON) a pri ďalšom behu
+s rovnakým problémom načítať bez jedinej evaluácie.
+"""
+
+import inspect
+import json
+import math
+import os
+
+import numpy as np
+
+
+class _ProbeBudgetExceeded(Exception):
+    """Minul sa rozpočet evaluácií na zisťovanie interakcií"""
+
+
+class _Prober:
+    """Počíta evaluácie fitness funkcie a stráži ich rozpočet"""
+
+    def __init__(self, fitness_function, max_evaluations):
+        self.fitness_function = fitness_function
+        self.fitness_batch = getattr(fitness_function, 'fitness_batch', None)
+        self.max_evaluations = max_evaluations
+        self.evaluations = 0
+
+    def __call__(self, solutions):
+        """Ohodnotí maticu riešení (N, D) a vráti vektor hodnôt"""
+        solutions = np.atleast_2d(solutions)
+        if (self.max_evaluations is not None
+                and self.evaluations + len(solutions) > self.max_evaluations):
+            raise _ProbeBudgetExceeded()
+        self.evaluations += len(solutions)
+        if self.fitness_batch is not None:
+            return np.asarray(self.fitness_batch(solutions), dtype=float)
+        return np.array([self.fitness_function(x) for x in solutions], dtype=float)
+
+
+def differential_grouping(fitness_function, dimensions, bounds, alpha=1e-12,
+                          samples=10, max_evaluations=None, separable_group_size=None,
+                          seed=0):
+    """
+    Rozdelí premenné na skupiny interagujúcich premenných (RDG)
+
+    Parametre:
+    - fitness_function: fitness funkcia problému (môže mať fitness_batch)
+    - dimensions: počet dimenzií
+    - bounds: hranice pre hodnoty (min, max)
+    - alpha: citlivosť - prah interakcie je alpha * min |f| z náhodných vzoriek
+    - samples: počet náhodných vzoriek pre odhad prahu
+    - max_evaluations: rozpočet evaluácií (None = bez obmedzenia). Keď sa
+      minie, zatiaľ nespracované premenné sa rozdelia ako separovateľné.
+    - separable_group_size: koľko separovateľných premenných dostane jeden
+      druh (None = medián veľkosti neseparovateľných skupín, pri úplne
+      separovateľnom probléme štvrtina premenných)
+    - seed: seed pre náhodné vzorky
+
+    Vráti slovník:
+    - groups: zoznam skupín indexov pre druhy (neseparovateľné skupiny
+      a separovateľné premenné rozdelené po separable_group_size)
+    - nonseparable: skupiny interagujúcich premenných
+    - separable: premenné bez interakcií
+    - evaluations: počet použitých evaluácií
+    - complete: False, ak sa minul rozpočet evaluácií
+    """
+    low, high = bounds
+    prober = _Prober(fitness_function, max_evaluations)
+    rng = np.random.default_rng(seed)
+
+    nonseparable = []
+    separable = []
+    remaining = []
+    complete = True
+    group = []
+    rest = list(range(dimensions))
+
+    def close(group):
+        # Jedna premenná bez interakcií je separovateľná
+        if len(group) == 1:
+            separable.extend(group)
+        else:
+            nonseparable.append(group)
+
+    try:
+        # Prah interakcie podľa veľkosti hodnôt funkcie (chyby zaokrúhlenia)
+        values = prober(rng.uniform(low, high, (samples, dimensions)))
+        epsilon = alpha * np.min(np.abs(values))
+
+        # Základný bod - všetky premenné na dolnej hranici
+        x_ll = np.full(dimensions, float(low))
+        f_ll = prober(x_ll)[0]
+
+        group = [0]
+        rest = list(range(1, dimensions))
+        while rest:
+            # Hodnota, keď sú premenné skupiny na hornej hranici
+            x_ul = x_ll.copy()
+            x_ul[group] = high
+            f_ul = prober(x_ul)[0]
+
+            extended = _interact(prober, group, rest, x_ll, x_ul, f_ll - f_ul,
+                                 (low + high) / 2, epsilon)
+            if len(extended) == len(group):
+                # Skupina už s ničím neinteraguje - uzavrieme ju
+                close(group)
+                group = [rest[0]]
+                rest = rest[1:]
+            else:
+                members = set(extended)
+                group = extended
+                rest = [v for v in rest if v not in members]
+        close(group)
+    except _ProbeBudgetExceeded:
+        # Rozpracovanú skupinu ponecháme, zvyšok považujeme za separovateľný
+        complete = False
+        if len(group) > 1:
+            nonseparable.append(group)
+        else:
+            remaining.extend(group)
+        remaining.extend(rest)
+
+    nonseparable = [sorted(int(v) for v in g) for g in nonseparable]
+    separable = sorted(int(v) for v in separable + remaining)
+
+    if separable_group_size is None:
+        if nonseparable:
+            separable_group_size = int(np.median([len(g) for g in nonseparable]))
+        else:
+            separable_group_size = math.ceil(len(separable) / 4)
+    separable_group_size = max(1, separable_group_size)
+
+    groups = list(nonseparable)
+    for start in range(0, len(separable), separable_group_size):
+        groups.append(separable[start:start + separable_group_size])
+
+    return {
+        'groups': groups,
+        'nonseparable': nonseparable,
+        'separable': separable,
+        'evaluations': prober.evaluations,
+        'complete': complete,
+    }
+
+
+def _interact(prober, group, candidates, x_ll, x_ul, delta1, middle, epsilon):
+    """
+    Vráti skupinu rozšírenú o premenné z candidates, ktoré s ňou interagujú
+
+    delta1 = f(x_ll) - f(x_ul) je efekt zmeny premenných skupiny; porovná
+    sa s tým istým efektom, keď sú kandidáti posunutí do stredu hraníc.
+    """
+    x_lm = x_ll.copy()
+    x_lm[candidates] = middle
+    x_um = x_ul.copy()
+    x_um[candidates] = middle
+    f_lm, f_um = prober(np.stack([x_lm, x_um]))
+    delta2 = f_lm - f_um
+
+    if abs(delta1 - delta2) <= epsilon:
+        return group
+    if len(candidates) == 1:
+        return group + list(candidates)
+
+    # Interakcia existuje - zistíme, s ktorou polovicou kandidátov
+    half = len(candidates) // 2
+    first = _interact(prober, group, candidates[:half], x_ll, x_ul, delta1, middle, epsilon)
+    second = _interact(prober, group, candidates[half:], x_ll, x_ul, delta1, middle, epsilon)
+    return first + second[len(group):]
+
+
+def function_name(fitness_function):
+    """
+    Stabilný názov fitness funkcie (None, ak ho nemá)
+
+    Použije atribút `name` (napr. LargeScaleProblem; evaluátory ho berú
+    z funkcie, ktorú obalia), inak modul a názov funkcie definovanej na
+    úrovni modulu. Lambda, lokálna funkcia, functools.partial, viazaná
+    metóda ani iný objekt bez atribútu `name` stabilný názov nemajú -
+    dve rôzne funkcie by dostali rovnaký.
+    """
+    name = getattr(fitness_function, 'name', None)
+    if name is not None:
+        return str(name)
+    if not inspect.isfunction(fitness_function):
+        return None
+    qualname = fitness_function.__qualname__
+    if '<lambda>' in qualname or '<locals>' in qualname:
+        return None
+    return f"{fitness_function.__module__}.{qualname}"
+
+
+def problem_key(fitness_function, dimensions, bounds):
+    """
+    Identifikátor problému pre cache zoskupení
+
+    Vyvolá ValueError, ak fitness funkcia nemá stabilný názov
+    (function_name) - zoskupenie by sa mohlo načítať pre iný problém.
+    """
+    name = function_name(fitness_function)
+    if name is None:
+        raise ValueError(
+            f"Fitness funkcia {fitness_function!r} nemá stabilný názov pre cache "
+            f"zoskupení - použite funkciu na úrovni modulu alebo objekt s atribútom 'name'"
+        )
+    low, high = bounds
+    return f"{name}_D{dimensions}_{float(low):g}_{float(high):g}"
+
+
+def get_grouping(fitness_function, dimensions, bounds, cache_dir=None, **options):
+    """
+    Zoskupenie premenných problému - z cache na disku alebo cez RDG
+
+    cache_dir: adresár pre uložené zoskupenia (None = bez cache); fitness
+        funkcia musí mať stabilný názov (function_name), inak ValueError
+    options: ďalšie parametre pre differential_grouping
+
+    Vráti slovník ako differential_grouping; pri načítaní z cache je
+    evaluations 0 (žiadne nové evaluácie). Do cache sa ukladajú len úplné
+    zoskupenia (complete).
+    """
+    path = None
+    if cache_dir is not None:
+        key = problem_key(fitness_function, dimensions, bounds)
+        # Rozpočet do kľúča nepatrí - ukladajú sa len úplné zoskupenia
+        key_options = {k: v for k, v in options.items() if k != 'max_evaluations'}
+        if key_options:
+            key += '_' + '_'.join(f"{k}={v}" for k, v in sorted(key_options.items()))
+        safe_key = ''.join(c if c.isalnum() or c in '._-=' else '_' for c in key)
+        path = os.path.join(cache_dir, f"{safe_key}.json")
+        if os.path.exists(path):
+            with open(path) as f:
+                grouping = json.load(f)
+            grouping['probe_evaluations'] = grouping['evaluations']
+            grouping['evaluations'] = 0
+            return grouping
+
+    grouping = differential_grouping(fitness_function, dimensions, bounds, **options)
+
+    # Neúplné zoskupenie (minul sa rozpočet) sa neukladá - pri väčšom
+    # rozpočte by sa dalo nájsť lepšie
+    if path is not None and grouping['complete']:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(grouping, f)
+        os.replace(temp_path, path)
+    return grouping
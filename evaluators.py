@@ -0,0 +1,329 @@
+"""
+Evaluátory pre drahé externé fitness funkcie
+
+Evaluátor obalí fitness funkciu do objektu, ktorý sa správa ako bežná
+fitness funkcia: volá sa pre jedno riešenie a má metódu fitness_batch pre
+maticu riešení (N, D). CooperativeCoevolution ho preto používa bez zmien -
+celá populácia druhu sa odovzdá naraz a evaluátor si sám rozhodne, ako
+riešenia ohodnotí.
+
+- AsyncEvaluator: fitness funkcia je korutina (napr. volanie simulátora cez
+  RPC) - riešenia dávky sa hodnotia súčasne v asyncio slučke s obmedzeným
+  počtom súčasných volaní a časovým limitom na jedno volanie
+- ProcessPoolEvaluator: pool dlho žijúcich procesov, ktoré dostávajú celé
+  dávky riešení v binárnom tvare cez rúry; spadnutý proces sa reštartuje
+"""
+
+import asyncio
+import inspect
+import multiprocessing
+import os
+import struct
+import traceback
+
+import numpy as np
+
+from decomposition import function_name
+
+
+class AsyncEvaluator:
+    """
+    Súčasné hodnotenie riešení cez asyncio
+
+    fitness_function môže byť korutina (async def f(x) -> float) alebo
+    obyčajná blokujúca funkcia - tá sa volá vo vláknach (asyncio.to_thread),
+    takže aj čakanie na I/O v nej prebieha súčasne.
+
+    Evaluátor má vlastnú udalostnú slučku, preto sa nesmie volať z kódu,
+    ktorý už beží v inej asyncio slučke.
+    """
+
+    def __init__(self, fitness_function, concurrency=16, timeout=None, timeout_fitness=None):
+        """
+        Parametre:
+        - fitness_function: korutina alebo funkcia, riešenie (vektor) -> fitness
+        - concurrency: najviac toľko volaní beží naraz
+        - timeout: časový limit jedného volania v sekundách (None = bez limitu)
+        - timeout_fitness: fitness pre riešenie, ktorého volanie prekročilo
+          limit (None = výnimka TimeoutError ukončí celú dávku)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency musí byť aspoň 1")
+        self.fitness_function = fitness_function
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.timeout_fitness = timeout_fitness
+        # Počet volaní, ktoré prekročili časový limit
+        self.timeouts = 0
+        self._loop = None
+
+    @property
+    def name(self):
+        """Názov obalenej fitness funkcie (napr. pre cache zoskupení)"""
+        return function_name(self.fitness_function)
+
+    def __getstate__(self):
+        # Slučka sa do iného procesu neposiela, vytvorí sa tam nová
+        state = self.__dict__.copy()
+        state['_loop'] = None
+        return state
+
+    def _get_loop(self):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def close(self):
+        """Zatvorí udalostnú slučku evaluátora"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
+
+    async def _evaluate_one(self, x, semaphore):
+        """Ohodnotí jedno riešenie (najviac `concurrency` naraz)"""
+        async with semaphore:
+            if inspect.iscoroutinefunction(self.fitness_function):
+                call = self.fitness_function(x)
+            else:
+                call = asyncio.to_thread(self.fitness_function, x)
+            try:
+                return float(await asyncio.wait_for(call, self.timeout))
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                if self.timeout_fitness is None:
+                    raise TimeoutError(
+                        f"Evaluácia prekročila časový limit {self.timeout}s"
+                    ) from None
+                return float(self.timeout_fitness)
+
+    async def evaluate_async(self, X):
+        """
+        Ohodnotí maticu riešení (N, D) súčasne - korutina pre použitie
+        v existujúcej asyncio slučke
+
+        Výsledky sa vrátia v poradí riadkov matice.
+        """
+        X = np.atleast_2d(X)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._evaluate_one(x, semaphore)) for x in X]
+        try:
+            values = await asyncio.gather(*tasks)
+        except BaseException:
+            # Pri chybe zrušíme zvyšné volania a počkáme, kým skončia,
+            # aby nebežali ďalej ani po návrate z run_until_complete
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return np.array(values, dtype=float)
+
+    def fitness_batch(self, X):
+        """Fitness pre maticu riešení (N, D) -> vektor N hodnôt"""
+        return self._get_loop().run_until_complete(self.evaluate_async(X))
+
+    def __call__(self, x):
+        """Fitness pre jedno riešenie"""
+        return float(self.fitness_batch(np.asarray(x)[None])[0])
+
+
+class ProcessPoolEvaluator:
+    """
+    Hodnotenie riešení v poole dlho žijúcich procesov
+
+    Každý proces si fitness funkciu načíta raz pri štarte (drahá
+    inicializácia simulátora sa teda platí len raz) a potom opakovane
+    hodnotí dávky riešení. Dávka sa rozdelí na súvislé časti, jedna na
+    proces, a pošle sa cez rúru (pipe) v kompaktnom binárnom tvare:
+    hlavička (počet riadkov, počet stĺpcov) + surové float64 čísla. Späť
+    príde stavový bajt a vektor float64 hodnôt.
+
+    Ak proces spadne (napr. pád natívneho simulátora), spustí sa nový
+    a jeho časť dávky sa pošle znova. Výnimka vo fitness funkcii sa
+    neopakuje - prenesie sa ako RuntimeError.
+
+    Procesy sa nezdieľajú s kópiami evaluátora (napr. v procesoch režimu
+    species_workers > 1) - tam by sa spúšťali znova v každej generácii,
+    preto je lepšie kombinovať evaluátor so sekvenčným režimom.
+    """
+
+    def __init__(self, fitness_function, workers=None, max_restarts=3, start_method=None):
+        """
+        Parametre:
+        - fitness_function: picklovateľná fitness funkcia (ak má fitness_batch,
+          proces ňou ohodnotí celú svoju časť dávky naraz)
+        - workers: počet procesov (None = počet jadier CPU)
+        - max_restarts: koľkokrát sa smie počas jednej dávky reštartovať proces
+        - start_method: spôsob spúšťania procesov ('fork', 'spawn', ...;
+          None = predvolený pre platformu)
+        """
+        self.fitness_function = fitness_function
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("workers musí byť aspoň 1")
+        self.max_restarts = max_restarts
+        self.start_method = start_method
+        # Počet reštartov procesov od vytvorenia evaluátora
+        self.restarts = 0
+        # Bežiace procesy a ich konce rúr (spustia sa pri prvom použití)
+        self._processes = [None] * self.workers
+        self._connections = [None] * self.workers
+
+    @property
+    def name(self):
+        """Názov obalenej fitness funkcie (napr. pre cache zoskupení)"""
+        return function_name(self.fitness_function)
+
+    def __getstate__(self):
+        # Procesy patria procesu, ktorý ich spustil - kópia si spustí vlastné
+        state = self.__dict__.copy()
+        state['_processes'] = [None] * self.workers
+        state['_connections'] = [None] * self.workers
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start_worker(self, index):
+        """Spustí (alebo po páde znova spustí) proces s daným indexom"""
+        self._stop_worker(index)
+        context = multiprocessing.get_context(self.start_method)
+        parent_end, child_end = context.Pipe()
+        process = context.Process(
+            target=_evaluation_worker, args=(child_end, self.fitness_function), daemon=True
+        )
+        process.start()
+        child_end.close()
+        self._processes[index] = process
+        self._connections[index] = parent_end
+
+    def _stop_worker(self, index, timeout=1.0):
+        """Ukončí proces (ak beží) a zatvorí jeho rúru"""
+        process = self._processes[index]
+        connection = self._connections[index]
+        if connection is not None:
+            try:
+                connection.send_bytes(b'')
+            except (OSError, ValueError):
+                pass
+            connection.close()
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._processes[index] = None
+        self._connections[index] = None
+
+    def close(self):
+        """Ukončí všetky procesy"""
+        for index in range(self.workers):
+            self._stop_worker(index)
+
+    def _send(self, index, chunk):
+        """Pošle časť dávky procesu (binárne: hlavička + float64 dáta)"""
+        if self._processes[index] is None or not self._processes[index].is_alive():
+            if self._processes[index] is not None:
+                self.restarts += 1
+            self._start_worker(index)
+        header = struct.pack('<qq', *chunk.shape)
+        self._connections[index].send_bytes(header + chunk.tobytes())
+
+    def _receive(self, index, rows):
+        """Prijme fitness hodnoty časti dávky od procesu"""
+        message = self._connections[index].recv_bytes()
+        if message[:1] == _WORKER_ERROR:
+            raise RuntimeError(
+                f"Fitness funkcia v procese {index} zlyhala:\n{message[1:].decode()}"
+            )
+        values = np.frombuffer(message, dtype=np.float64, offset=1)
+        if len(values) != rows:
+            raise RuntimeError(f"Proces {index} vrátil {len(values)} hodnôt namiesto {rows}")
+        return values
+
+    def fitness_batch(self, X):
+        """Fitness pre maticu riešení (N, D) -> vektor N hodnôt"""
+        X = np.ascontiguousarray(np.atleast_2d(X), dtype=np.float64)
+        fitness = np.empty(len(X))
+        # Súvislé časti dávky - jedna na proces (prázdne sa neposielajú)
+        bounds = np.linspace(0, len(X), min(self.workers, len(X)) + 1).astype(int)
+        pending = {
+            index: (start, end)
+            for index, (start, end) in enumerate(zip(bounds[:-1], bounds[1:]))
+        }
+
+        restarts = 0
+        while pending:
+            sent = {}
+            for index, (start, end) in pending.items():
+                try:
+                    self._send(index, X[start:end])
+                    sent[index] = (start, end)
+                except (OSError, ValueError):
+                    pass  # proces spadol - časť ostane v pending
+            failed = {index: pending[index] for index in pending if index not in sent}
+            # Odpovede prečítame od všetkých procesov aj po chybe v jednom z nich,
+            # inak by v rúrach ostali a ďalšia dávka by ich prečítala ako svoje
+            error = None
+            for index, (start, end) in sent.items():
+                try:
+                    fitness[start:end] = self._receive(index, end - start)
+                except (EOFError, OSError):
+                    failed[index] = (start, end)
+                except RuntimeError as exc:
+                    error = error or exc
+            if error is not None:
+                for index in failed:
+                    self._stop_worker(index)
+                raise error
+
+            # Spadnuté procesy reštartujeme a ich časti pošleme znova
+            for index in failed:
+                self._stop_worker(index)
+                self.restarts += 1
+                restarts += 1
+                if restarts > self.max_restarts:
+                    raise RuntimeError(
+                        f"Procesy evaluátora opakovane padajú ({restarts} reštartov v jednej dávke)"
+                    )
+            pending = failed
+        return fitness
+
+    def __call__(self, x):
+        """Fitness pre jedno riešenie"""
+        return float(self.fitness_batch(np.asarray(x)[None])[0])
+
+
+# Stavový bajt odpovede procesu
+_WORKER_OK = b'\x00'
+_WORKER_ERROR = b'\x01'
+
+
+def _evaluation_worker(connection, fitness_function):
+    """
+    Hlavná slučka procesu ProcessPoolEvaluator
+
+    Prijíma dávky (hlavička + float64 dáta) a posiela späť fitness hodnoty.
+    Prázdna správa znamená koniec.
+    """
+    fitness_batch = getattr(fitness_function, 'fitness_batch', None)
+    while True:
+        try:
+            message = connection.recv_bytes()
+        except (EOFError, OSError):
+            break
+        if not message:
+            break
+        rows, cols = struct.unpack_from('<qq', message)
+        X = np.frombuffer(message, dtype=np.float64, offset=16).reshape(rows, cols)
+        try:
+            if fitness_batch is not None:
+                values = np.asarray(fitness_batch(X), dtype=np.float64)
+            else:
+                values = np.array([fitness_function(x) for x in X], dtype=np.float64)
+            connection.send_bytes(_WORKER_OK + values.tobytes())
+        except Exception:
+            connection.send_bytes(_WORKER_ERROR + traceback.format_exc().encode())
+    connection.close()
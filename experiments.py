@@ -4,10 +4,15 @@ Experimenty pre testovanie kooperatívneho koevolučného algoritmu
 Tento skript spúšťa experimenty s rôznymi konfiguráciami a zbiera výsledky.
 """
 
+import inspect
 import numpy as np
+import os
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from cooperative_coevolution import CooperativeCoevolution
+from racing import friedman_test, worse_than_best
+from result_store import ResultStore, cell_key
 from problems import (
     get_rastrigin_problem,
     get_model_optimization_problem,
@@ -16,12 +21,122 @@ from problems import (
 )
 
 
+def run_single(fitness_function, dimensions, bounds, config, verbose=True, seed=None,
+               profile=False):
+    """
+    Spustí jeden beh algoritmu s danou konfiguráciou
+
+    Funkcia je na úrovni modulu, aby sa dala poslať do procesu v poole
+    (fitness_function preto musí byť picklovateľná - napr. funkcia
+    definovaná na úrovni modulu).
+
+    seed: seed behu (int, np.random.SeedSequence alebo None)
+    profile: či merať čas jednotlivých fáz algoritmu (výsledok v kľúči 'profile')
+    
+    Vráti slovník s výsledkom behu (fitness, riešenie, čas, konvergencia).
+    """
+    # Zmeriame čas
+    start_time = time.time()
+    
+    # Históriu riešení experimenty nepotrebujú (stačí fitness história),
+    # preto ju vypneme, ak ju konfigurácia výslovne nezapína
+    options = {'history_every': 0, 'profile': profile}
+    options.update(config)
+    
+    # Vytvoríme algoritmus s danou konfiguráciou
+    ccea = CooperativeCoevolution(
+        fitness_function=fitness_function,
+        dimensions=dimensions,
+        bounds=bounds,
+        verbose=verbose,
+        seed=seed,
+        **options
+    )
+    
+    # Spustíme algoritmus
+    best_solution, best_fitness = ccea.run()
+    
+    # Zmeriame čas behu
+    elapsed_time = time.time() - start_time
+    
+    return {
+        'fitness': float(best_fitness),
+        'solution': best_solution,
+        'time': elapsed_time,
+        'convergence': ccea.best_fitness_history.copy(),
+        'evaluations': ccea.evaluations,
+        'generations': ccea.generations_completed,
+        'termination_reason': ccea.termination_reason,
+        'profile': ccea.profile_summary()
+    }
+
+
+# Predvolené parametre algoritmu (pre odhad ceny behu)
+_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(CooperativeCoevolution.__init__).parameters.items()
+}
+
+
+# Parametre s cestou k súboru jedného behu - pri viacerých behoch by si
+# ich behy navzájom prepisovali, preto ich experimenty nepovoľujú
+PER_RUN_PATHS = ('history_file', 'checkpoint_file')
+
+
+def estimate_cost(experiment):
+    """
+    Odhad ceny jedného behu experimentu (evaluácie * dimenzie)
+
+    Každá generácia ohodnotí populácie všetkých druhov; cena evaluácie je
+    úmerná počtu dimenzií. Slúži len na poradie behov v poole.
+    """
+    config = experiment['config']
+    setting = lambda name: config.get(name, _DEFAULTS[name])
+    # Pri vlastných skupinách je druhov toľko ako skupín ('auto' nevieme vopred)
+    groups = setting('groups')
+    num_species = len(groups) if isinstance(groups, list) else setting('num_species')
+    evaluations = setting('generations') * num_species * setting('population_size')
+    if setting('max_evaluations') is not None:
+        evaluations = min(evaluations, setting('max_evaluations'))
+    return evaluations * experiment['dimensions']
+
+
 class ExperimentRunner:
     """Spúšťa experimenty a zbiera výsledky"""
     
-    def __init__(self, num_runs=10):
+    def __init__(self, num_runs=10, parallel=False, workers=None, seed=None, profile=False,
+                 store=None):
+        """
+        Parametre:
+        - num_runs: koľkokrát spustíme každý experiment
+        - parallel: či spúšťať behy paralelne v poole procesov
+        - workers: počet procesov (None = počet jadier CPU)
+        - seed: hlavný seed (None = náhodný). Beh r dostane vlastný
+          SeedSequence odvodený z hlavného seedu - rovnaký pre všetky
+          konfigurácie, takže konfigurácie sa porovnávajú na rovnakých
+          náhodných číslach a výsledok nezávisí od poradia behov v poole.
+        - profile: meranie času fáz algoritmu; priemer cez behy je vo výsledku
+          v kľúči 'profile'
+        - store: ResultStore alebo cesta k adresáru - každý dokončený beh sa
+          hneď uloží a už uložené behy (rovnaký problém, konfigurácia, seed
+          a číslo behu) sa pri ďalšom spustení preskočia. Bez zadaného seedu
+          sa použije hlavný seed z úložiska, aby sa dalo pokračovať.
+        """
         # Koľkokrát spustíme každý experiment (pre spoľahlivejšie výsledky)
         self.num_runs = num_runs
+        # Paralelný režim - každý beh (konfigurácia, beh) ide do poolu procesov
+        self.parallel = parallel
+        self.workers = workers if workers is not None else os.cpu_count()
+        # Úložisko výsledkov jednotlivých behov
+        if isinstance(store, str):
+            store = ResultStore(store)
+        self.store = store
+        if seed is None and store is not None:
+            seed = store.master_seed()
+        # Hlavný seed - entropiu si zapamätáme, aby sa dal beh zopakovať
+        self.seed = np.random.SeedSequence(seed).entropy
+        # Meranie času fáz algoritmu
+        self.profile = profile
         # Zoznam všetkých výsledkov
         self.results = []
     
@@ -36,50 +151,281 @@ class ExperimentRunner:
         - bounds: hranice pre hodnoty
         - config: slovník s konfiguráciou algoritmu
         """
-        print(f"\n{'='*60}")
-        print(f"Experiment: {problem_name}")
-        print(f"Konfigurácia: {config}")
-        print(f"{'='*60}\n")
+        experiment = {
+            'problem_name': problem_name,
+            'fitness_function': fitness_function,
+            'dimensions': dimensions,
+            'bounds': bounds,
+            'config': config
+        }
+        return self.run_experiments([experiment])[0]
+    
+    def run_experiments(self, experiments):
+        """
+        Spustí viac experimentov naraz
+
+        experiments: zoznam slovníkov s kľúčmi problem_name, fitness_function,
+            dimensions, bounds a config (rovnaké ako parametre run_experiment);
+            voliteľne problem - základný názov problému pre kľúč v úložisku
+            (predvolene problem_name)
+
+        Vráti zoznam výsledkov v rovnakom poradí ako experiments.
+        Všetky dvojice (experiment, beh) sa spustia cez _run_jobs - v paralelnom
+        režime naraz v poole procesov, výsledky sa zbierajú tak, ako dobiehajú.
+        """
+        jobs = [(index, run) for index in range(len(experiments)) for run in range(self.num_runs)]
+        results = self._run_jobs(experiments, jobs)
+        runs = [[results[index, run] for run in range(self.num_runs)]
+                for index in range(len(experiments))]
         
-        # Zoznamy pre ukladanie výsledkov zo všetkých behov
-        all_fitnesses = []      # všetky fitness hodnoty
-        all_solutions = []      # všetky riešenia
-        all_times = []          # všetky časy behu
-        convergence_data = []   # história konvergencie pre každý beh
+        return [
+            self._aggregate(experiment['problem_name'], experiment['config'], runs[index])
+            for index, experiment in enumerate(experiments)
+        ]
+    
+    def run_race(self, experiments, min_runs=5, alpha=0.05, budget=None, max_runs=None,
+                 round_runs=1):
+        """
+        Porovná konfigurácie s vyraďovaním (F-race, pozri racing.py)
         
-        # Spustíme experiment viackrát
-        for run in range(self.num_runs):
-            print(f"Beh {run + 1}/{self.num_runs}")
-            
-            # Zmeriame čas
-            start_time = time.time()
-            
-            # Vytvoríme algoritmus s danou konfiguráciou
-            ccea = CooperativeCoevolution(
-                fitness_function=fitness_function,
-                dimensions=dimensions,
-                bounds=bounds,
-                num_species=config['num_species'],
-                population_size=config['population_size'],
-                generations=config['generations'],
-                mutation_rate=config['mutation_rate'],
-                crossover_rate=config['crossover_rate'],
-                collaboration_size=config['collaboration_size']
-            )
-            
-            # Spustíme algoritmus
-            best_solution, best_fitness = ccea.run()
-            
-            # Zmeriame čas behu
-            elapsed_time = time.time() - start_time
+        Konfigurácie sa spúšťajú po kolách seedov; od min_runs behov sa po
+        každom kole spraví Friedmanov test a konfigurácie významne horšie
+        ako najlepšia sa ďalej nespúšťajú. Ušetrené behy dostanú zvyšné
+        konfigurácie (aj viac ako num_runs), kým sa neminie rozpočet alebo
+        nezostane jediná konfigurácia - tá sa doplní na num_runs behov.
+        
+        Parametre:
+        - experiments: experimenty na rovnakom probléme (ako pre run_experiments)
+        - min_runs: počet behov každej konfigurácie pred prvým testom
+        - alpha: hladina významnosti testov
+        - budget: celkový počet behov (None = num_runs * počet experimentov,
+          teda rovnako ako run_experiments)
+        - max_runs: najviac behov jednej konfigurácie (None = bez obmedzenia)
+        - round_runs: počet seedov v jednom kole (v paralelnom režime väčšie
+          kolá lepšie vyťažia procesy, ale vyraďuje sa zriedkavejšie)
+        
+        Vráti zoznam výsledkov v rovnakom poradí ako experiments; každý má
+        navyše kľúč 'race' (status 'survivor' alebo 'eliminated', počet behov
+        a P-hodnota Friedmanovho testu pri vyradení).
+        """
+        if len(experiments) < 2:
+            raise ValueError("Racing potrebuje aspoň 2 konfigurácie")
+        if min_runs < 2:
+            raise ValueError("min_runs musí byť aspoň 2")
+        if round_runs < 1:
+            raise ValueError("round_runs musí byť aspoň 1")
+        if budget is None:
+            budget = self.num_runs * len(experiments)
+        
+        runs = [[] for _ in experiments]
+        alive = list(range(len(experiments)))
+        eliminated = {}
+        completed = 0
+        used = 0
+        while len(alive) > 1:
+            # Prvé kolo doplní behy do min_runs, ďalšie pridávajú round_runs seedov
+            size = max(round_runs, min_runs - completed)
+            if max_runs is not None:
+                size = min(size, max_runs - completed)
+            size = min(size, (budget - used) // len(alive))
+            if size <= 0:
+                break
+            new_runs = range(completed, completed + size)
+            results = self._run_jobs(experiments, [(index, run) for index in alive for run in new_runs])
+            for index in alive:
+                runs[index].extend(results[index, run] for run in new_runs)
+            completed += size
+            used += size * len(alive)
+            if completed < min_runs:
+                continue
             
-            # Uložíme výsledky
-            all_fitnesses.append(best_fitness)
-            all_solutions.append(best_solution)
-            all_times.append(elapsed_time)
-            convergence_data.append(ccea.best_fitness_history)
+            # Blok testu = jeden seed (rovnaký pre všetky konfigurácie)
+            values = np.array([[runs[index][run]['fitness'] for index in alive]
+                               for run in range(completed)])
+            test = friedman_test(values)
+            worse = worse_than_best(values, alpha, test)
+            print(f"\nKolo po {completed} behoch: {len(alive)} konfigurácií, "
+                  f"Friedman p = {test['p_value']:.4g}")
+            for position in worse:
+                index = alive[position]
+                eliminated[index] = test['p_value']
+                print(f"  Vyradená: {experiments[index]['problem_name']}")
+            alive = [index for position, index in enumerate(alive) if position not in worse]
+        
+        # Víťaz dostane aspoň num_runs behov ako pri bežnom experimente
+        if len(alive) == 1:
+            target = self.num_runs if max_runs is None else min(self.num_runs, max_runs)
+            new_runs = range(completed, max(completed, target))
+            if new_runs:
+                index = alive[0]
+                results = self._run_jobs(experiments, [(index, run) for run in new_runs])
+                runs[index].extend(results[index, run] for run in new_runs)
+                used += len(new_runs)
+        
+        print(f"\nRacing: {used} behov z rozpočtu {budget}, "
+              f"zostáva {len(alive)} z {len(experiments)} konfigurácií")
+        
+        results = []
+        for index, experiment in enumerate(experiments):
+            if not runs[index]:
+                # Rozpočet nestačí ani na jeden beh každej konfigurácie
+                raise ValueError(f"Rozpočet {budget} behov nestačí pre {len(experiments)} konfigurácií")
+            result = self._aggregate(experiment['problem_name'], experiment['config'], runs[index])
+            result['race'] = {
+                'status': 'eliminated' if index in eliminated else 'survivor',
+                'runs': len(runs[index]),
+                'p_value': eliminated.get(index),
+            }
+            results.append(result)
+        return results
+    
+    def run_seed(self, run):
+        """SeedSequence pre beh s poradovým číslom run"""
+        return np.random.SeedSequence(self.seed, spawn_key=(run,))
+    
+    def _cell_key(self, experiment, run):
+        """
+        Kľúč behu v úložisku výsledkov
+
+        Použije základný názov problému (kľúč 'problem'), nie zobrazovaný
+        názov s názvom konfigurácie - premenovanie konfigurácie tak
+        nespôsobí opakovanie uložených behov.
+        """
+        problem = experiment.get('problem', experiment['problem_name'])
+        return cell_key(problem, experiment['dimensions'],
+                        experiment['bounds'], experiment['config'], self.seed, run)
+    
+    def _load_stored_run(self, experiment, run):
+        """Výsledok behu z úložiska (None, ak tam nie je)"""
+        if self.store is None:
+            return None
+        key = self._cell_key(experiment, run)
+        record = self.store.get(key)
+        if record is None:
+            return None
+        arrays = self.store.load_arrays(key)
+        result = {name: record[name] for name in (
+            'fitness', 'time', 'evaluations', 'generations', 'termination_reason', 'profile'
+        )}
+        result['solution'] = arrays['solution']
+        result['convergence'] = arrays['convergence']
+        return result
+    
+    def _store_run(self, experiment, run, result):
+        """Uloží dokončený beh do úložiska (ak je zadané)"""
+        if self.store is None:
+            return
+        record = {
+            'problem': experiment['problem_name'],
+            'config_name': experiment.get('config_name'),
+            'optimal_value': experiment.get('optimal_value'),
+            'config': experiment['config'],
+            'dimensions': experiment['dimensions'],
+            'bounds': list(experiment['bounds']),
+            'seed': self.seed,
+            'run': run,
+            'fitness': result['fitness'],
+            'time': result['time'],
+            'evaluations': result['evaluations'],
+            'generations': result['generations'],
+            'termination_reason': result['termination_reason'],
+            'profile': result.get('profile'),
+        }
+        arrays = {
+            'convergence': np.asarray(result['convergence']),
+            'solution': np.asarray(result['solution']),
+        }
+        self.store.append(self._cell_key(experiment, run), record, arrays)
+    
+    def _run_jobs(self, experiments, jobs):
+        """
+        Spustí zadané dvojice (index experimentu, číslo behu)
+
+        Behy uložené z predchádzajúceho spustenia sa nespúšťajú znova.
+        Konfigurácia nesmie obsahovať PER_RUN_PATHS (ValueError).
+        V paralelnom režime sa behy do poolu posielajú od najdrahšieho
+        (estimate_cost), aby na konci nečakal jeden dlhý beh na voľný proces.
+
+        Vráti slovník {(index, beh): výsledok}.
+        """
+        for experiment in experiments:
+            paths = [name for name in PER_RUN_PATHS if experiment['config'].get(name) is not None]
+            if paths:
+                raise ValueError(
+                    f"Experiment '{experiment['problem_name']}': parametre {paths} nie sú "
+                    f"v experimentoch povolené (všetky behy by zapisovali do rovnakého súboru)"
+                )
+        
+        results = {}
+        pending = []
+        for index, run in jobs:
+            result = self._load_stored_run(experiments[index], run)
+            if result is not None:
+                results[index, run] = result
+            else:
+                pending.append((index, run))
+        stored = len(jobs) - len(pending)
+        total = len(pending)
+        parallel = self.parallel and self.workers > 1
+        print(f"\nSpúšťam {total} behov"
+              f"{f' v {self.workers} procesoch' if parallel else ''}"
+              f"{f' ({stored} už uložených)' if stored else ''}...")
+        
+        def report(done, index, run, result):
+            print(f"[{done}/{total}] {experiments[index]['problem_name']}, "
+                  f"beh {run + 1}: fitness {result['fitness']:.6f}, "
+                  f"čas {result['time']:.2f}s")
+        
+        if not parallel:
+            for done, (index, run) in enumerate(pending, start=1):
+                experiment = experiments[index]
+                result = run_single(
+                    experiment['fitness_function'],
+                    experiment['dimensions'],
+                    experiment['bounds'],
+                    experiment['config'],
+                    verbose=False,
+                    seed=self.run_seed(run),
+                    profile=self.profile
+                )
+                self._store_run(experiment, run, result)
+                results[index, run] = result
+                report(done, index, run, result)
+            return results
+        
+        costs = [estimate_cost(experiment) for experiment in experiments]
+        pending.sort(key=lambda job: -costs[job[0]])
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {}
+            for index, run in pending:
+                experiment = experiments[index]
+                future = pool.submit(
+                    run_single,
+                    experiment['fitness_function'],
+                    experiment['dimensions'],
+                    experiment['bounds'],
+                    experiment['config'],
+                    False,
+                    self.run_seed(run),
+                    self.profile
+                )
+                futures[future] = (index, run)
             
-            print(f"  Fitness: {best_fitness:.6f}, Čas: {elapsed_time:.2f}s\n")
+            # Výsledky zbierame tak, ako dobiehajú
+            for done, future in enumerate(as_completed(futures), start=1):
+                index, run = futures[future]
+                result = future.result()
+                self._store_run(experiments[index], run, result)
+                results[index, run] = result
+                report(done, index, run, result)
+        return results
+    
+    def _aggregate(self, problem_name, config, runs):
+        """Vypočíta štatistiky experimentu zo zoznamu výsledkov jeho behov"""
+        all_fitnesses = [run['fitness'] for run in runs]
+        all_times = [run['time'] for run in runs]
+        convergence_data = [run['convergence'] for run in runs]
         
         # Vypočítame štatistiky
         fitnesses_array = np.array(all_fitnesses)
@@ -88,7 +434,8 @@ class ExperimentRunner:
         results = {
             'problem': problem_name,
             'config': config,
-            'num_runs': self.num_runs,
+            'num_runs': len(runs),
+            'seed': self.seed,
             'fitness_mean': float(np.mean(fitnesses_array)),      # priemer
             'fitness_std': float(np.std(fitnesses_array)),       # štandardná odchýlka
             'fitness_min': float(np.min(fitnesses_array)),       # minimum
@@ -96,11 +443,41 @@ class ExperimentRunner:
             'time_mean': float(np.mean(all_times)),              # priemerný čas
             'time_std': float(np.std(all_times)),                # štandardná odchýlka času
             'convergence': self._average_convergence(convergence_data),  # priemerná konvergencia
-            'all_fitnesses': [float(f) for f in all_fitnesses]   # všetky fitness hodnoty
+            'all_fitnesses': [float(f) for f in all_fitnesses],  # všetky fitness hodnoty
+            'evaluations_mean': float(np.mean([run['evaluations'] for run in runs])),
+            'generations_mean': float(np.mean([run['generations'] for run in runs])),
+            'termination_reasons': [run['termination_reason'] for run in runs]
         }
         
+        profiles = [run['profile'] for run in runs if run.get('profile')]
+        if profiles:
+            results['profile'] = self._average_profile(profiles)
+        
         return results
     
+    def _average_profile(self, profiles):
+        """
+        Priemer meraní fáz cez behy (čas a počet volaní na beh)
+
+        Kľúče druhov sú reťazce, aby sa výsledok dal uložiť do JSON.
+        """
+        count = len(profiles)
+        
+        def add(target, phase, record):
+            total = target.setdefault(phase, {'time': 0.0, 'calls': 0.0})
+            total['time'] += record['time'] / count
+            total['calls'] += record['calls'] / count
+        
+        phases = {}
+        species = {}
+        for profile in profiles:
+            for phase, record in profile['phases'].items():
+                add(phases, phase, record)
+            for index, species_phases in profile['species'].items():
+                for phase, record in species_phases.items():
+                    add(species.setdefault(str(index), {}), phase, record)
+        return {'phases': phases, 'species': species}
+    
     def _average_convergence(self, convergence_data):
         """
         Vypočíta priemernú konvergenciu cez všetky behy
@@ -138,29 +515,90 @@ class ExperimentRunner:
         print(f"  Najlepšia fitness: {results['fitness_max']:.6f}")
         print(f"  Najhoršia fitness: {results['fitness_min']:.6f}")
         print(f"  Priemerný čas: {results['time_mean']:.2f}s ± {results['time_std']:.2f}s")
+        if 'evaluations_mean' in results:
+            print(f"  Priemerný počet evaluácií: {results['evaluations_mean']:.0f}")
+            reasons = {}
+            for reason in results['termination_reasons']:
+                reasons[reason] = reasons.get(reason, 0) + 1
+            print(f"  Dôvody ukončenia: {reasons}")
+        if 'profile' in results:
+            phases = results['profile']['phases']
+            total = sum(record['time'] for record in phases.values())
+            print("\nČas fáz (priemer na beh):")
+            for phase, record in sorted(phases.items(), key=lambda item: -item[1]['time']):
+                share = record['time'] / total * 100 if total > 0 else 0.0
+                print(f"  {phase}: {record['time']:.3f}s ({share:.1f}%), "
+                      f"{record['calls']:.0f} volaní")
         print(f"{'='*60}\n")
 
 
-def main():
-    """Hlavná funkcia pre spustenie experimentov"""
+def load_stored_results(store, with_convergence=True):
+    """
+    Zostaví výsledky experimentov (ako v experiment_results.json) z úložiska
+
+    store: ResultStore alebo cesta k adresáru
+    with_convergence: či načítať aj konvergenčné dáta (.npz súbory);
+        bez nich sa prečíta len runs.jsonl a kľúč 'convergence' chýba
+
+    Behy sa zoskupia podľa (problém, konfigurácia, seed) v poradí, v akom
+    boli prvýkrát uložené.
+    """
+    if isinstance(store, str):
+        store = ResultStore(store)
+    
+    groups = {}
+    for record in store.iter_records():
+        group_key = json.dumps([record['problem'], record['config'], record['seed']],
+                               sort_keys=True, default=str)
+        groups.setdefault(group_key, {})[record['run']] = record
     
-    # Vytvoríme runner, ktorý spustí každý experiment 10-krát
-    runner = ExperimentRunner(num_runs=10)
-    all_results = []
+    results = []
+    for records in groups.values():
+        records = [records[run] for run in sorted(records)]
+        first = records[0]
+        runs = []
+        for record in records:
+            run = dict(record)
+            run['convergence'] = (
+                store.load_arrays(record['key'])['convergence'] if with_convergence else []
+            )
+            runs.append(run)
+        runner = ExperimentRunner(num_runs=len(runs), seed=first['seed'])
+        result = runner._aggregate(first['problem'], first['config'], runs)
+        if not with_convergence:
+            del result['convergence']
+        result['config_name'] = first.get('config_name')
+        result['optimal_value'] = first.get('optimal_value')
+        results.append(result)
+    return results
+
+
+def _strip_name(config):
+    """Vytvorí kópiu konfigurácie bez názvu (ten nepotrebujeme v algoritme)"""
+    config_copy = {}
+    for k, v in config.items():
+        if k != 'name':
+            config_copy[k] = v
+    return config_copy
+
+
+def build_experiments():
+    """
+    Zostaví zoznam všetkých experimentov (oba problémy, všetky konfigurácie)
+
+    Každý experiment je slovník pre ExperimentRunner.run_experiments
+    doplnený o config_name a optimal_value.
+    """
+    experiments = []
     
     # ========================================================================
     # PROBLÉM 1: Rastrigin funkcia
     # ========================================================================
     
-    print("\n" + "="*60)
-    print("PROBLÉM 1: Optimalizácia Rastrigin funkcie")
-    print("="*60)
-    
     dimensions = 30
     fitness_func, dims, bounds = get_rastrigin_problem(dimensions)
     optimal_value = get_optimal_value_rastrigin(dimensions)
     
-    # Rôzne konfigurácie pre testovanie
     configs = [
         {
             'name': 'Základná konfigurácia',
@@ -209,45 +647,26 @@ def main():
         }
     ]
     
-    # Spustíme každú konfiguráciu
     for config in configs:
-        config_name = config['name']
-        # Vytvoríme kópiu konfigurácie bez názvu (ten nepotrebujeme v algoritme)
-        config_copy = {}
-        for k, v in config.items():
-            if k != 'name':
-                config_copy[k] = v
-        
-        # Spustíme experiment
-        result = runner.run_experiment(
-            problem_name=f"Rastrigin - {config_name}",
-            fitness_function=fitness_func,
-            dimensions=dimensions,
-            bounds=bounds,
-            config=config_copy
-        )
-        
-        # Pridáme názov konfigurácie a optimálnu hodnotu
-        result['config_name'] = config_name
-        result['optimal_value'] = optimal_value
-        all_results.append(result)
-        
-        # Vytlačíme výsledky
-        runner.print_results(result)
+        experiments.append({
+            'problem_name': f"Rastrigin - {config['name']}",
+            'problem': 'Rastrigin',
+            'fitness_function': fitness_func,
+            'dimensions': dimensions,
+            'bounds': bounds,
+            'config': _strip_name(config),
+            'config_name': config['name'],
+            'optimal_value': optimal_value
+        })
     
     # ========================================================================
     # PROBLÉM 2: Optimalizácia parametrov modelu
     # ========================================================================
     
-    print("\n" + "="*60)
-    print("PROBLÉM 2: Optimalizácia parametrov matematického modelu")
-    print("="*60)
-    
     dimensions = 20
     fitness_func, dims, bounds = get_model_optimization_problem(dimensions)
     optimal_value = get_optimal_value_model(dimensions)
     
-    # Rôzne konfigurácie pre testovanie
     configs = [
         {
             'name': 'Základná konfigurácia',
@@ -287,28 +706,54 @@ def main():
         }
     ]
     
-    # Spustíme každú konfiguráciu
     for config in configs:
-        config_name = config['name']
-        # Vytvoríme kópiu konfigurácie bez názvu
-        config_copy = {}
-        for k, v in config.items():
-            if k != 'name':
-                config_copy[k] = v
-        
-        # Spustíme experiment
-        result = runner.run_experiment(
-            problem_name=f"Model - {config_name}",
-            fitness_function=fitness_func,
-            dimensions=dimensions,
-            bounds=bounds,
-            config=config_copy
-        )
-        
+        experiments.append({
+            'problem_name': f"Model - {config['name']}",
+            'problem': 'Model',
+            'fitness_function': fitness_func,
+            'dimensions': dimensions,
+            'bounds': bounds,
+            'config': _strip_name(config),
+            'config_name': config['name'],
+            'optimal_value': optimal_value
+        })
+    
+    return experiments
+
+
+def main(parallel=False, workers=None, seed=None, store_dir=None, num_runs=10,
+         output_file='experiment_results.json'):
+    """
+    Hlavná funkcia pre spustenie experimentov
+
+    parallel: či spúšťať behy paralelne v poole procesov
+    workers: počet procesov (None = počet jadier CPU)
+    seed: hlavný seed pre reprodukovateľné experimenty (None = náhodný)
+    store_dir: adresár úložiska výsledkov - behy sa ukladajú priebežne
+        a prerušené experimenty pokračujú tam, kde skončili
+    num_runs: koľkokrát sa spustí každá konfigurácia
+    output_file: JSON súbor so súhrnnými výsledkami
+
+    Vráti zoznam výsledkov experimentov.
+    """
+    
+    # Vytvoríme runner, ktorý spustí každý experiment num_runs-krát
+    runner = ExperimentRunner(num_runs=num_runs, parallel=parallel, workers=workers, seed=seed,
+                              store=store_dir)
+    experiments = build_experiments()
+    
+    print("\n" + "="*60)
+    print(f"Spúšťam {len(experiments)} experimentov "
+          f"(Rastrigin funkcia, optimalizácia parametrov modelu)")
+    print("="*60)
+    
+    # Spustíme všetky konfigurácie (v paralelnom režime naraz v jednom poole)
+    all_results = runner.run_experiments(experiments)
+    
+    for experiment, result in zip(experiments, all_results):
         # Pridáme názov konfigurácie a optimálnu hodnotu
-        result['config_name'] = config_name
-        result['optimal_value'] = optimal_value
-        all_results.append(result)
+        result['config_name'] = experiment['config_name']
+        result['optimal_value'] = experiment['optimal_value']
         
         # Vytlačíme výsledky
         runner.print_results(result)
@@ -318,13 +763,15 @@ def main():
     # ========================================================================
     
     # Uložíme výsledky do JSON súboru
-    with open('experiment_results.json', 'w') as f:
+    with open(output_file, 'w') as f:
         json.dump(all_results, f, indent=2)
     
     print("\n" + "="*60)
     print("Všetky experimenty dokončené!")
-    print("Výsledky uložené do 'experiment_results.json'")
+    print(f"Výsledky uložené do '{output_file}'")
     print("="*60)
+    
+    return all_results
 
 
 if __name__ == '__main__':
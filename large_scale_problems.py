@@ -0,0 +1,324 @@
+"""
+Veľkorozmerné testovacie problémy (1000+ dimenzií)
+
+Problémy v štýle CEC súťaže pre veľkorozmernú globálnu optimalizáciu (LSGO):
+- základné funkcie: Elliptic, Rastrigin, Ackley, Schwefel 1.2
+- posunuté optimum (shift vektor), aby nebolo v strede hraníc
+- časti premenných tvoria podkomponenty, ktoré sa otočia náhodnou
+  ortogonálnou maticou - premenné v nich sú navzájom závislé
+- podkomponenty sa môžu prekrývať (susedné zdieľajú niekoľko premenných)
+
+Typy problémov (názov = typ_funkcia, napr. 'partial_rastrigin'):
+1. shifted    - úplne separovateľný, len posunutý
+2. partial    - niekoľko otočených podkomponentov, zvyšok separovateľný
+3. nonseparable - podkomponenty pokrývajú skoro všetky premenné
+4. overlapping - podkomponenty sa navzájom prekrývajú
+
+Ackley a Schwefel 1.2 nie sú aditívne separovateľné (Schwefel 1.2 je
+súčet cez všetky premenné), preto sa na separovateľnom zvyšku počítajú
+po jednotlivých premenných - zvyšok Schwefel problémov je teda sféra.
+
+Shift vektor, permutácia premenných a rotačné matice sa generujú
+deterministicky zo seedu. Voliteľne sa uložia do adresára ako .npy súbory
+a načítajú cez memory-mapping (pri veľkých dimenziách nezaberajú RAM
+v každom procese poolu zvlášť).
+
+Všetky funkcie sú vektorizované - ohodnotia maticu (N, D) naraz.
+"""
+
+import os
+
+import numpy as np
+
+
+# ============================================================================
+# Základné funkcie (minimalizácia, z je matica (N, d))
+# ============================================================================
+
+def elliptic_function(z):
+    """Elliptic: sum(10^(6*i/(d-1)) * z_i^2), minimum 0 v bode 0"""
+    d = z.shape[-1]
+    if d > 1:
+        weights = 10.0 ** (6.0 * np.arange(d) / (d - 1))
+    else:
+        weights = np.ones(1)
+    return np.sum(weights * z**2, axis=-1)
+
+
+def rastrigin_function(z):
+    """Rastrigin: sum(z_i^2 - 10*cos(2*pi*z_i) + 10), minimum 0 v bode 0"""
+    return np.sum(z**2 - 10 * np.cos(2 * np.pi * z) + 10, axis=-1)
+
+
+def ackley_function(z):
+    """Ackley: minimum 0 v bode 0"""
+    d = z.shape[-1]
+    square_mean = np.sum(z**2, axis=-1) / d
+    cos_mean = np.sum(np.cos(2 * np.pi * z), axis=-1) / d
+    return 20 - 20 * np.exp(-0.2 * np.sqrt(square_mean)) - np.exp(cos_mean) + np.e
+
+
+def schwefel_function(z):
+    """Schwefel 1.2: sum((z_1 + ... + z_i)^2), neseparovateľná, minimum 0 v bode 0"""
+    return np.sum(np.cumsum(z, axis=-1)**2, axis=-1)
+
+
+# Základná funkcia -> (funkcia, hranice)
+BASE_FUNCTIONS = {
+    'elliptic': (elliptic_function, (-100.0, 100.0)),
+    'rastrigin': (rastrigin_function, (-5.0, 5.0)),
+    'ackley': (ackley_function, (-32.0, 32.0)),
+    'schwefel': (schwefel_function, (-100.0, 100.0)),
+}
+
+# Základné funkcie, ktoré sa na separovateľnom zvyšku počítajú po
+# jednotlivých premenných (inak by zvyšok nebol separovateľný)
+PER_VARIABLE_BASES = {'ackley', 'schwefel'}
+
+# Typ problému -> (počet podkomponentov, prekrytie susedných podkomponentov)
+PROBLEM_TYPES = {
+    'shifted': (0, 0),
+    'partial': (7, 0),
+    'nonseparable': (20, 0),
+    'overlapping': (20, 5),
+}
+
+# Veľkosti podkomponentov pre 1000 dimenzií (pri iných sa škálujú)
+SUBCOMPONENT_SIZES = (25, 50, 100)
+
+# Maximálny počet prvkov medzivýsledku pri dávkovej evaluácii
+MAX_BATCH_ELEMENTS = 2 ** 22
+
+
+class LargeScaleProblem:
+    """
+    Veľkorozmerný problém - fitness funkcia pre CooperativeCoevolution
+
+    f(x) = sum_k w_k * base(R_k * z[S_k]) + base(z[zvyšok]),   z = x - shift
+
+    Pre funkcie z PER_VARIABLE_BASES je posledný člen sum_i base(z_i) cez
+    zvyšné premenné, aby zvyšok ostal separovateľný.
+
+    kde S_k sú indexy k-teho podkomponentu (po náhodnej permutácii
+    premenných), R_k ortogonálna rotačná matica a w_k váha podkomponentu.
+
+    Objekt sa volá ako funkcia (jedno riešenie -> fitness) a má metódu
+    fitness_batch (matica riešení -> vektor fitness), takže ho algoritmus
+    ohodnocuje po dávkach. Fitness je negovaná hodnota funkcie (algoritmus
+    maximalizuje), optimum je 0 v bode shift.
+    """
+
+    def __init__(self, base, dimensions=1000, num_groups=7, overlap=0,
+                 rotate=True, seed=0, data_dir=None):
+        """
+        Parametre:
+        - base: názov základnej funkcie z BASE_FUNCTIONS
+        - dimensions: počet dimenzií
+        - num_groups: počet podkomponentov (0 = úplne separovateľný problém)
+        - overlap: koľko premenných zdieľajú susedné podkomponenty
+        - rotate: či podkomponenty otočiť (inak sú len váhované)
+        - seed: seed pre generovanie shiftu, permutácie a rotácií
+        - data_dir: adresár, kam sa dáta uložia ako .npy súbory; pri ďalšom
+          vytvorení (aj v inom procese) sa načítajú cez memory-mapping
+        """
+        if base not in BASE_FUNCTIONS:
+            raise ValueError(
+                f"Neznáma základná funkcia '{base}', možnosti: {sorted(BASE_FUNCTIONS)}"
+            )
+        if overlap < 0:
+            raise ValueError("overlap musí byť nezáporný")
+
+        self.base = base
+        self.function, self.bounds = BASE_FUNCTIONS[base]
+        self.dimensions = dimensions
+        self.num_groups = num_groups
+        self.overlap = overlap
+        self.rotate = rotate
+        self.seed = seed
+        self.data_dir = data_dir
+        # Optimálna hodnota fitness (v bode shift)
+        self.optimal_value = 0.0
+
+        self._load_data()
+
+    @property
+    def name(self):
+        """Názov problému (použije sa aj pre súbory s dátami)"""
+        return (f"{self.base}_D{self.dimensions}_g{self.num_groups}"
+                f"_o{self.overlap}_r{int(self.rotate)}_s{self.seed}")
+
+    def _group_sizes(self, rng):
+        """
+        Náhodné veľkosti podkomponentov (z SUBCOMPONENT_SIZES, škálované
+        na počet dimenzií) - pridávajú sa, kým sa zmestia do dimenzií
+        """
+        scale = self.dimensions / 1000
+        sizes = []
+        covered = 0
+        for _ in range(self.num_groups):
+            size = max(2, int(round(rng.choice(SUBCOMPONENT_SIZES) * scale)))
+            extra = size - (self.overlap if sizes else 0)
+            if extra <= 0 or covered + extra > self.dimensions:
+                break
+            sizes.append(size)
+            covered += extra
+        return sizes
+
+    def _generate_data(self):
+        """Deterministicky vygeneruje shift, permutáciu, skupiny a rotácie"""
+        rng = np.random.default_rng(self.seed)
+        low, high = self.bounds
+        # Optimum necháme kúsok od hraníc
+        shift = rng.uniform(0.8 * low, 0.8 * high, self.dimensions)
+        permutation = rng.permutation(self.dimensions)
+
+        sizes = self._group_sizes(rng)
+        # Začiatky podkomponentov v permutácii (susedné sa prekrývajú)
+        starts = [sum(sizes[:k]) - self.overlap * k for k in range(len(sizes))]
+        weights = 10.0 ** rng.normal(0.0, 1.0, len(sizes))
+
+        # Jedna rotačná matica pre každú veľkosť podkomponentu (ako v CEC)
+        rotations = {}
+        if self.rotate:
+            for size in sorted(set(sizes)):
+                q, r = np.linalg.qr(rng.standard_normal((size, size)))
+                # Znamienka podľa diagonály R, aby bola matica rovnomerne náhodná
+                rotations[size] = q * np.sign(np.diag(r))
+
+        return {
+            'shift': shift,
+            'permutation': permutation,
+            'sizes': np.asarray(sizes, dtype=np.int64),
+            'starts': np.asarray(starts, dtype=np.int64),
+            'weights': weights,
+            'rotations': rotations,
+        }
+
+    def _load_data(self):
+        """Načíta dáta z data_dir (memory-mapping) alebo ich vygeneruje"""
+        if self.data_dir is None:
+            data = self._generate_data()
+        else:
+            prefix = os.path.join(self.data_dir, self.name)
+            if not os.path.exists(f"{prefix}_shift.npy"):
+                self._save_data(prefix, self._generate_data())
+            data = {
+                key: np.load(f"{prefix}_{key}.npy", mmap_mode='r')
+                for key in ('shift', 'permutation', 'sizes', 'starts', 'weights')
+            }
+            data['rotations'] = {
+                int(size): np.load(f"{prefix}_rotation{int(size)}.npy", mmap_mode='r')
+                for size in set(data['sizes'].tolist())
+            } if self.rotate else {}
+
+        self.shift = data['shift']
+        self.weights = data['weights']
+        self.rotations = data['rotations']
+        permutation = np.asarray(data['permutation'])
+
+        # Indexy premenných každého podkomponentu a zvyšných (separovateľných)
+        self.groups = [
+            permutation[start:start + size]
+            for start, size in zip(data['starts'].tolist(), data['sizes'].tolist())
+        ]
+        covered = np.zeros(self.dimensions, dtype=bool)
+        for group in self.groups:
+            covered[group] = True
+        self.separable = np.flatnonzero(~covered)
+
+    def _save_data(self, prefix, data):
+        """Uloží dáta ako .npy súbory (najprv dočasné, potom premenovanie)"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        arrays = {key: data[key] for key in ('permutation', 'sizes', 'starts', 'weights')}
+        for size, rotation in data['rotations'].items():
+            arrays[f"rotation{size}"] = rotation
+        # Shift ukladáme posledný - jeho existencia znamená, že dáta sú kompletné
+        arrays['shift'] = data['shift']
+        for key, array in arrays.items():
+            temp_path = f"{prefix}_{key}.tmp.npy"
+            np.save(temp_path, array)
+            os.replace(temp_path, f"{prefix}_{key}.npy")
+
+    def __getstate__(self):
+        """Pri poslaní do procesu posielame len parametre, ak sú dáta na disku"""
+        state = self.__dict__.copy()
+        if self.data_dir is not None:
+            for key in ('shift', 'weights', 'rotations', 'groups', 'separable'):
+                del state[key]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if 'shift' not in state:
+            self._load_data()
+
+    def evaluate(self, X):
+        """Hodnota funkcie (minimalizácia) pre maticu riešení (N, D)"""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        values = np.empty(len(X))
+        # Po častiach, aby medzivýsledky neboli príliš veľké
+        rows_per_batch = max(1, MAX_BATCH_ELEMENTS // self.dimensions)
+        for start in range(0, len(X), rows_per_batch):
+            end = min(start + rows_per_batch, len(X))
+            z = X[start:end] - self.shift
+            total = np.zeros(end - start)
+            for k, group in enumerate(self.groups):
+                block = z[:, group]
+                if self.rotate:
+                    block = block @ self.rotations[len(group)].T
+                total += self.weights[k] * self.function(block)
+            if len(self.separable) > 0:
+                rest = z[:, self.separable]
+                if self.base in PER_VARIABLE_BASES:
+                    total += np.sum(self.function(rest[:, :, None]), axis=-1)
+                else:
+                    total += self.function(rest)
+            values[start:end] = total
+        return values
+
+    def fitness_batch(self, X):
+        """Fitness pre maticu riešení (N, D) -> vektor N hodnôt"""
+        return -self.evaluate(X)
+
+    def __call__(self, x):
+        """Fitness pre jedno riešenie (čím väčšie, tým lepšie)"""
+        return -float(self.evaluate(x)[0])
+
+
+def get_large_scale_problem(name, dimensions=1000, seed=0, data_dir=None):
+    """
+    Vráti veľkorozmerný problém podľa názvu 'typ_funkcia'
+
+    Parametre:
+    - name: napr. 'shifted_elliptic', 'partial_rastrigin',
+      'nonseparable_ackley', 'overlapping_schwefel' (pozri PROBLEM_TYPES
+      a BASE_FUNCTIONS)
+    - dimensions: počet dimenzií (napr. 1000)
+    - seed: seed pre generovanie dát problému
+    - data_dir: adresár pre dáta na disku (None = len v pamäti)
+
+    Vráti:
+    - fitness_function: LargeScaleProblem (čím väčšie, tým lepšie)
+    - dimensions: počet dimenzií
+    - bounds: hranice pre hodnoty (min, max)
+    """
+    kind, _, base = name.partition('_')
+    if kind not in PROBLEM_TYPES or base not in BASE_FUNCTIONS:
+        raise ValueError(f"Neznámy problém '{name}', možnosti: {large_scale_problem_names()}")
+
+    num_groups, overlap = PROBLEM_TYPES[kind]
+    problem = LargeScaleProblem(
+        base,
+        dimensions=dimensions,
+        num_groups=num_groups,
+        overlap=overlap,
+        rotate=num_groups > 0,
+        seed=seed,
+        data_dir=data_dir
+    )
+    return problem, dimensions, problem.bounds
+
+
+def large_scale_problem_names():
+    """Zoznam názvov všetkých veľkorozmerných problémov"""
+    return [f"{kind}_{base}" for kind in PROBLEM_TYPES for base in BASE_FUNCTIONS]
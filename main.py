@@ -1,12 +1,32 @@
 """
 Hlavný skript pre spúšťanie všetkých funkcionalít projektu
 Kooperatívny koevolučný algoritmus - HOP Zadanie 1
+
+Bez argumentov sa spustí interaktívne menu. S podpríkazom beží bez
+interakcie (dávkové úlohy, cron):
+
+    python main.py run --problem rastrigin --dimensions 30 --runs 10 --workers 4
+    python main.py sweep --runs 10 --workers 8 --seed 1 --output-dir results
+    python main.py sweep --grid sweep_example.json --workers 8 --output-dir study
+    python main.py sweep --grid sweep_example.json --race --output-dir race
+    python main.py visualize --input results --output-dir plots
+    python main.py summary --input results
+    python main.py benchmark --preset quick
+
+Návratové kódy: 0 = úspech, 1 = chyba, 2 = zlé argumenty, 130 = prerušené.
 """
 
+import argparse
+import json
 import os
 import sys
 from typing import Optional
 
+# Návratové kódy príkazového riadku
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_INTERRUPTED = 130
+
 
 def clear_screen():
     """Vymaže obrazovku"""
@@ -95,9 +115,6 @@ def show_summary():
         return
     
     try:
-        import json
-        from visualize_results import create_summary_table
-        
         with open('experiment_results.json', 'r') as f:
             results = json.load(f)
         
@@ -106,26 +123,7 @@ def show_summary():
             input("\nStlačte Enter pre pokračovanie...")
             return
         
-        print(create_summary_table(results, "Rastrigin"))
-        print(create_summary_table(results, "Model"))
-        
-        # Zobrazenie základných štatistík
-        print("\n" + "="*70)
-        print("ZÁKLADNÉ ŠTATISTIKY")
-        print("="*70)
-        
-        rastrigin_results = [r for r in results if 'Rastrigin' in r['problem']]
-        model_results = [r for r in results if 'Model' in r['problem']]
-        
-        if rastrigin_results:
-            best_rastrigin = max(rastrigin_results, key=lambda x: x['fitness_mean'])
-            print(f"\nNajlepšia konfigurácia pre Rastrigin: {best_rastrigin['config_name']}")
-            print(f"  Priemerná fitness: {best_rastrigin['fitness_mean']:.6f}")
-        
-        if model_results:
-            best_model = max(model_results, key=lambda x: x['fitness_mean'])
-            print(f"\nNajlepšia konfigurácia pre Model: {best_model['config_name']}")
-            print(f"  Priemerná fitness: {best_model['fitness_mean']:.6f}")
+        print_summary(results)
         
         input("\nStlačte Enter pre pokračovanie...")
     except Exception as e:
@@ -135,6 +133,26 @@ def show_summary():
         input("\nStlačte Enter pre pokračovanie...")
 
 
+def print_summary(results):
+    """Vytlačí súhrnné tabuľky a najlepšiu konfiguráciu pre každý problém"""
+    from visualize_results import create_summary_table, problem_groups, select_problem
+    
+    problems = problem_groups(results)
+    for problem in problems:
+        print(create_summary_table(results, problem))
+    
+    # Zobrazenie základných štatistík
+    print("\n" + "="*70)
+    print("ZÁKLADNÉ ŠTATISTIKY")
+    print("="*70)
+    
+    for problem in problems:
+        problem_results = select_problem(results, problem)
+        best = max(problem_results, key=lambda x: x['fitness_mean'])
+        print(f"\nNajlepšia konfigurácia pre {problem}: {best['config_name']}")
+        print(f"  Priemerná fitness: {best['fitness_mean']:.6f}")
+
+
 def show_project_info():
     """Zobrazí informácie o projekte"""
     print("\n" + "="*70)
@@ -179,8 +197,8 @@ pre štatistickú významnosť výsledkov.
     input("\nStlačte Enter pre pokračovanie...")
 
 
-def main():
-    """Hlavná funkcia programu"""
+def interactive_menu():
+    """Interaktívne menu (spustí sa, keď main.py nedostane argumenty)"""
     while True:
         clear_screen()
         print_header()
@@ -214,6 +232,217 @@ def main():
             input("\nStlačte Enter pre pokračovanie...")
 
 
+# ============================================================================
+# Príkazový riadok (bez interakcie)
+# ============================================================================
+
+def load_config(path):
+    """
+    Načíta konfiguráciu algoritmu z JSON súboru
+
+    Súbor obsahuje slovník parametrov CooperativeCoevolution; voliteľný
+    kľúč 'name' je názov konfigurácie vo výsledkoch.
+    """
+    with open(path, encoding='utf-8') as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(f"Konfigurácia v '{path}' musí byť JSON objekt")
+    return config
+
+
+def results_path(output_dir):
+    """Cesta k súhrnným výsledkom v adresári výsledkov"""
+    return os.path.join(output_dir, 'experiment_results.json')
+
+
+def command_run(args):
+    """Podpríkaz run - jedna konfigurácia na jednom probléme"""
+    from experiments import ExperimentRunner, _strip_name, load_stored_results
+    from problems import get_problem
+    
+    config = load_config(args.config) if args.config else {}
+    if args.generations is not None:
+        config['generations'] = args.generations
+    config_name = config.get('name', 'Konfigurácia')
+    fitness_function, dimensions, bounds = get_problem(args.problem, args.dimensions)
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    runner = ExperimentRunner(num_runs=args.runs, parallel=args.workers > 1,
+                              workers=args.workers, seed=args.seed, store=args.output_dir)
+    experiment = {
+        'problem_name': f"{args.problem} - {config_name}",
+        'problem': args.problem,
+        'fitness_function': fitness_function,
+        'dimensions': dimensions,
+        'bounds': bounds,
+        'config': _strip_name(config),
+        'config_name': config_name,
+        'optimal_value': getattr(fitness_function, 'optimal_value', 0.0)
+    }
+    result = runner.run_experiments([experiment])[0]
+    result['config_name'] = config_name
+    result['optimal_value'] = experiment['optimal_value']
+    runner.print_results(result)
+    
+    # Súhrn sa zostaví z celého úložiska - obsahuje aj konfigurácie
+    # z predchádzajúcich spustení do toho istého adresára
+    with open(results_path(args.output_dir), 'w') as f:
+        json.dump(load_stored_results(runner.store), f, indent=2)
+    print(f"Výsledky uložené do '{results_path(args.output_dir)}'")
+    return EXIT_OK
+
+
+def command_sweep(args):
+    """
+    Podpríkaz sweep - štúdia zo súboru (--grid) alebo všetky konfigurácie
+    zo štandardných experimentov
+    """
+    if args.grid:
+        from sweep import run_sweep
+        run_sweep(args.grid, args.output_dir, args.runs, args.workers, args.seed, args.race)
+        return EXIT_OK
+    if args.race:
+        print("✗ --race sa dá použiť len so štúdiou zo súboru (--grid)", file=sys.stderr)
+        return EXIT_ERROR
+    
+    from experiments import main as experiments_main
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    experiments_main(parallel=args.workers > 1, workers=args.workers, seed=args.seed,
+                     store_dir=args.output_dir, num_runs=args.runs or 10,
+                     output_file=results_path(args.output_dir))
+    return EXIT_OK
+
+
+def load_cli_results(path):
+    """Výsledky zo súboru alebo z adresára výsledkov (úložiska)"""
+    from experiments import load_stored_results
+    
+    if os.path.isdir(path):
+        summary = results_path(path)
+        if os.path.exists(summary):
+            with open(summary) as f:
+                return json.load(f)
+        return load_stored_results(path, with_convergence=False)
+    with open(path) as f:
+        return json.load(f)
+
+
+def command_visualize(args):
+    """Podpríkaz visualize - grafy a tabuľky"""
+    from visualize_results import visualize
+    
+    if visualize(args.input, args.output_dir) == 0:
+        print("✗ Žiadne výsledky na vizualizáciu", file=sys.stderr)
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def command_summary(args):
+    """Podpríkaz summary - textový súhrn výsledkov"""
+    results = load_cli_results(args.input)
+    if not results:
+        print("✗ Žiadne výsledky", file=sys.stderr)
+        return EXIT_ERROR
+    print_summary(results)
+    return EXIT_OK
+
+
+def command_benchmark(args):
+    """Podpríkaz benchmark - benchmarky rýchlosti a pamäte"""
+    from benchmarks import run_benchmarks
+    
+    report = run_benchmarks(args.preset, args.problems, args.generations, args.repeat)
+    os.makedirs(args.output_dir, exist_ok=True)
+    output = os.path.join(args.output_dir, 'benchmark_results.json')
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nVýsledky uložené do '{output}'")
+    return EXIT_OK
+
+
+def build_parser():
+    """Parser argumentov príkazového riadku"""
+    from benchmarks import PRESETS, PROBLEMS as BENCHMARK_PROBLEMS
+    from problems import problem_names
+    
+    parser = argparse.ArgumentParser(
+        description="Kooperatívny koevolučný algoritmus - HOP Zadanie 1 "
+                    "(bez argumentov sa spustí interaktívne menu)"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    def add_experiment_options(command, runs=10):
+        command.add_argument('--runs', type=int, default=runs, help="počet behov každej konfigurácie")
+        command.add_argument('--workers', type=int, default=1, help="počet procesov (1 = sekvenčne)")
+        command.add_argument('--seed', type=int, help="hlavný seed (predvolene náhodný)")
+        command.add_argument('--output-dir', default='results', help="adresár výsledkov")
+    
+    run = commands.add_parser('run', help="spustí jednu konfiguráciu na jednom probléme")
+    run.add_argument('--problem', choices=problem_names(), default='rastrigin')
+    run.add_argument('--dimensions', type=int, help="počet dimenzií (predvolene podľa problému)")
+    run.add_argument('--config', help="JSON súbor s parametrami algoritmu")
+    run.add_argument('--generations', type=int, help="počet generácií (prepíše konfiguráciu)")
+    add_experiment_options(run)
+    run.set_defaults(handler=command_run)
+    
+    sweep = commands.add_parser('sweep', help="spustí štúdiu zo súboru alebo štandardné experimenty")
+    sweep.add_argument('--grid', help="JSON súbor so štúdiou (mriežka konfigurácií, pozri sweep.py)")
+    sweep.add_argument('--race', action='store_const', const=True,
+                       help="racing - významne horšie konfigurácie sa vyraďujú po kolách seedov")
+    # Bez --runs sa použije hodnota zo súboru štúdie (inak 10)
+    add_experiment_options(sweep, runs=None)
+    sweep.set_defaults(handler=command_sweep)
+    
+    visualize = commands.add_parser('visualize', help="vytvorí grafy a tabuľky z výsledkov")
+    visualize.add_argument('--input', default='results',
+                           help="JSON s výsledkami alebo adresár výsledkov")
+    visualize.add_argument('--output-dir', default='.', help="adresár pre grafy")
+    visualize.set_defaults(handler=command_visualize)
+    
+    summary = commands.add_parser('summary', help="vytlačí súhrn výsledkov")
+    summary.add_argument('--input', default='results',
+                         help="JSON s výsledkami alebo adresár výsledkov")
+    summary.set_defaults(handler=command_summary)
+    
+    benchmark = commands.add_parser('benchmark', help="spustí benchmarky rýchlosti")
+    benchmark.add_argument('--preset', choices=sorted(PRESETS), default='quick')
+    benchmark.add_argument('--problems', nargs='+', choices=sorted(BENCHMARK_PROBLEMS))
+    benchmark.add_argument('--generations', type=int, default=5)
+    benchmark.add_argument('--repeat', type=int, default=5)
+    benchmark.add_argument('--output-dir', default='.', help="adresár pre benchmark_results.json")
+    benchmark.set_defaults(handler=command_benchmark)
+    
+    return parser
+
+
+def main(argv=None):
+    """
+    Vstupný bod programu - bez argumentov interaktívne menu, inak podpríkaz
+
+    Vráti návratový kód procesu.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        interactive_menu()
+        return EXIT_OK
+    
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except KeyboardInterrupt:
+        print("\nPrerušené používateľom.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    except (OSError, ValueError) as e:
+        print(f"✗ Chyba: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        print(f"✗ Neočakávaná chyba: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
 
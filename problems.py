@@ -8,6 +8,8 @@ Obsahuje dva problémy:
 
 import numpy as np
 
+from large_scale_problems import get_large_scale_problem, large_scale_problem_names
+
 
 # ============================================================================
 # PROBLÉM 1: Rastrigin funkcia
@@ -20,16 +22,53 @@ def rastrigin_function(x):
     
     Vzorec: f(x) = 10*n + sum(x_i^2 - 10*cos(2*pi*x_i))
     Minimum: f(0, ..., 0) = 0
+    
+    x môže byť jeden vektor (vráti číslo) alebo matica tvaru (N, D),
+    kde riadok = jedno riešenie (vráti vektor N hodnôt)
     """
-    n = len(x)  # počet dimenzií
+    x = np.asarray(x, dtype=float)
+    n = x.shape[-1]  # počet dimenzií
     A = 10
     
-    # Vypočítame hodnotu funkcie
-    result = A * n
-    for i in range(n):
-        result += x[i]**2 - A * np.cos(2 * np.pi * x[i])
-    
-    return result
+    # Vypočítame hodnotu funkcie naraz pre všetky dimenzie
+    return A * n + np.sum(x**2 - A * np.cos(2 * np.pi * x), axis=-1)
+
+
+def rastrigin_fitness(x):
+    """Fitness pre Rastrigin (čím väčšie, tým lepšie) - jedno riešenie"""
+    # Vrátime negatívnu hodnotu, lebo algoritmus maximalizuje
+    # (čím menšia hodnota Rastrigin, tým lepšie)
+    return -float(rastrigin_function(x))
+
+
+def rastrigin_fitness_batch(X):
+    """Fitness pre Rastrigin - matica riešení (N, D) -> vektor N hodnôt"""
+    return -rastrigin_function(np.atleast_2d(X))
+
+
+def rastrigin_block_contribution(context, indices, block_genes):
+    """
+    Príspevok dimenzií `indices` k súčtu Rastrigin funkcie
+
+    Rastrigin je úplne separovateľná: f(x) = sum(10 + x_i^2 - 10*cos(2*pi*x_i)),
+    takže príspevok bloku závisí len od jeho vlastných génov.
+    block_genes: matica (N, len(indices)) -> vráti vektor N príspevkov
+    """
+    block = np.atleast_2d(block_genes)
+    A = 10
+    return np.sum(A + block**2 - A * np.cos(2 * np.pi * block), axis=-1)
+
+
+def rastrigin_combine(total):
+    """Z celkového súčtu príspevkov vypočíta fitness (negovaná Rastrigin)"""
+    return -total
+
+
+# Algoritmus si dávkovú verziu nájde cez atribút fitness_batch
+rastrigin_fitness.fitness_batch = rastrigin_fitness_batch
+# Inkrementálna (delta) evaluácia po blokoch
+rastrigin_fitness.block_contribution = rastrigin_block_contribution
+rastrigin_fitness.combine = rastrigin_combine
 
 
 def get_rastrigin_problem(dimensions=30):
@@ -44,23 +83,20 @@ def get_rastrigin_problem(dimensions=30):
     - dimensions: počet dimenzií
     - bounds: hranice pre hodnoty (min, max)
     """
-    def fitness(x):
-        # Vypočítame hodnotu Rastrigin funkcie
-        value = rastrigin_function(x)
-        # Vrátime negatívnu hodnotu, lebo algoritmus maximalizuje
-        # (čím menšia hodnota Rastrigin, tým lepšie)
-        return -value
-    
     # Hranice pre hodnoty (štandardné pre Rastrigin)
     bounds = (-5.12, 5.12)
     
-    return fitness, dimensions, bounds
+    return rastrigin_fitness, dimensions, bounds
 
 
 # ============================================================================
 # PROBLÉM 2: Optimalizácia parametrov matematického modelu
 # ============================================================================
 
+# Cieľová hodnota, ktorú chceme dosiahnuť
+MODEL_TARGET_VALUE = 100.0
+
+
 def mathematical_model(x):
     """
     Optimalizácia parametrov matematického modelu
@@ -69,40 +105,93 @@ def mathematical_model(x):
     kde a_i, b_i, c_i, d_i sú parametre, ktoré chceme optimalizovať
     
     Cieľ: Minimalizovať chybu medzi modelom a cieľovou hodnotou
+    
+    x môže byť jeden vektor (vráti číslo) alebo matica tvaru (N, D),
+    kde riadok = jedno riešenie (vráti vektor N hodnôt)
     """
-    n = len(x) // 4  # Každá skupina má 4 parametre (a, b, c, d)
-    
-    # Ak sa nedelí rovnomerne, doplníme nulami
-    if len(x) % 4 != 0:
-        # Pridáme nuly na koniec
-        x = np.pad(x, (0, 4 - (len(x) % 4)), mode='constant')
-        n = len(x) // 4
-    
-    # Cieľová hodnota, ktorú chceme dosiahnuť
-    target_value = 100.0
-    
-    # Vypočítame hodnotu modelu
-    model_value = 0.0
-    for i in range(n):
-        # Zoberieme 4 parametre pre túto skupinu
-        a = x[i * 4]      # parameter a
-        b = x[i * 4 + 1]  # parameter b
-        c = x[i * 4 + 2]  # parameter c
-        d = x[i * 4 + 3]  # parameter d
-        
-        # Použijeme pevné vstupné hodnoty pre model
-        input_val = i + 1
-        
-        # Vypočítame príspevok tejto skupiny
-        contribution = a * np.sin(b * input_val) + c * np.cos(d * input_val)
-        model_value += contribution
+    x = np.asarray(x, dtype=float)
+    
+    # Ak sa nedelí rovnomerne, doplníme nulami na koniec
+    if x.shape[-1] % 4 != 0:
+        padding = [(0, 0)] * (x.ndim - 1) + [(0, 4 - (x.shape[-1] % 4))]
+        x = np.pad(x, padding, mode='constant')
+    n = x.shape[-1] // 4  # Každá skupina má 4 parametre (a, b, c, d)
+    
+    # Rozdelíme parametre na skupiny (a, b, c, d)
+    groups = x.reshape(x.shape[:-1] + (n, 4))
+    a = groups[..., 0]
+    b = groups[..., 1]
+    c = groups[..., 2]
+    d = groups[..., 3]
+    
+    # Použijeme pevné vstupné hodnoty pre model (1, 2, ..., n)
+    input_val = np.arange(1, n + 1)
+    
+    # Vypočítame hodnotu modelu (súčet príspevkov všetkých skupín)
+    model_value = np.sum(a * np.sin(b * input_val) + c * np.cos(d * input_val),
+                         axis=-1)
     
     # Vypočítame chybu (RMSE - Root Mean Square Error)
-    error = (model_value - target_value) ** 2
+    error = (model_value - MODEL_TARGET_VALUE) ** 2
     
     return error
 
 
+def model_fitness(x):
+    """Fitness pre model (čím väčšie, tým lepšie) - jedno riešenie"""
+    # Vrátime negatívnu hodnotu, lebo algoritmus maximalizuje
+    # (čím menšia chyba, tým lepšie)
+    return -float(mathematical_model(x))
+
+
+def model_fitness_batch(X):
+    """Fitness pre model - matica riešení (N, D) -> vektor N hodnôt"""
+    return -mathematical_model(np.atleast_2d(X))
+
+
+def model_block_contribution(context, indices, block_genes):
+    """
+    Príspevok skupín (a, b, c, d), ktorých sa týkajú dimenzie `indices`,
+    k hodnote modelu
+
+    Model je čiastočne separovateľný - hodnota modelu je súčet príspevkov
+    skupín po 4 parametroch. Chýbajúce parametre skupiny (mimo bloku) sa
+    vezmú z kontextového vektora `context`.
+    block_genes: matica (N, len(indices)) -> vráti vektor N príspevkov
+    """
+    block = np.atleast_2d(block_genes)
+    indices = np.asarray(indices)
+    
+    # Skupiny, do ktorých blok zasahuje, a ich parametre z kontextu
+    groups = np.unique(indices // 4)
+    columns = groups[:, None] * 4 + np.arange(4)
+    params = np.zeros(columns.shape)
+    # Parametre za koncom vektora sú doplnené nuly (ako v mathematical_model)
+    inside = columns < len(context)
+    params[inside] = context[columns[inside]]
+    
+    # Gény bloku prepíšu zodpovedajúce parametre
+    local = np.repeat(params[None], len(block), axis=0)
+    local[:, np.searchsorted(groups, indices // 4), indices % 4] = block
+    
+    a = local[..., 0]
+    b = local[..., 1]
+    c = local[..., 2]
+    d = local[..., 3]
+    input_val = groups + 1
+    return np.sum(a * np.sin(b * input_val) + c * np.cos(d * input_val), axis=-1)
+
+
+def model_combine(total):
+    """Z hodnoty modelu (súčet príspevkov) vypočíta fitness (negovaná chyba)"""
+    return -(total - MODEL_TARGET_VALUE) ** 2
+
+
+model_fitness.fitness_batch = model_fitness_batch
+model_fitness.block_contribution = model_block_contribution
+model_fitness.combine = model_combine
+
+
 def get_model_optimization_problem(dimensions=20):
     """
     Vráti problém optimalizácie parametrov modelu
@@ -115,17 +204,10 @@ def get_model_optimization_problem(dimensions=20):
     - dimensions: počet dimenzií
     - bounds: hranice pre hodnoty (min, max)
     """
-    def fitness(x):
-        # Vypočítame chybu modelu
-        error = mathematical_model(x)
-        # Vrátime negatívnu hodnotu, lebo algoritmus maximalizuje
-        # (čím menšia chyba, tým lepšie)
-        return -error
-    
     # Hranice pre hodnoty parametrov
     bounds = (-10.0, 10.0)
     
-    return fitness, dimensions, bounds
+    return model_fitness, dimensions, bounds
 
 
 # ============================================================================
@@ -150,3 +232,33 @@ def get_optimal_value_model(dimensions):
     (minimálna chyba)
     """
     return 0.0
+
+
+# ============================================================================
+# Výber problému podľa názvu
+# ============================================================================
+
+def problem_names():
+    """Názvy všetkých problémov pre get_problem"""
+    return ['rastrigin', 'model'] + large_scale_problem_names()
+
+
+def get_problem(name, dimensions=None):
+    """
+    Vráti problém podľa názvu
+
+    Parametre:
+    - name: 'rastrigin', 'model' alebo názov veľkorozmerného problému
+      (napr. 'partial_rastrigin', pozri large_scale_problems)
+    - dimensions: počet dimenzií (None = predvolený: 30 pre Rastrigin,
+      20 pre model, 1000 pre veľkorozmerné problémy)
+
+    Vráti (fitness_function, dimensions, bounds) ako get_rastrigin_problem.
+    """
+    if name == 'rastrigin':
+        return get_rastrigin_problem(dimensions or 30)
+    if name == 'model':
+        return get_model_optimization_problem(dimensions or 20)
+    if name in large_scale_problem_names():
+        return get_large_scale_problem(name, dimensions or 1000)
+    raise ValueError(f"Neznámy problém '{name}', možnosti: {problem_names()}")
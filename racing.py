@@ -0,0 +1,217 @@
+"""
+Racing - skoré vyraďovanie zlých konfigurácií (F-race, Birattari a kol. 2002)
+
+Namiesto num_runs behov pre každú konfiguráciu sa konfigurácie spúšťajú
+po kolách: v každom kole dostane každá ešte súťažiaca konfigurácia ďalší
+seed. Behy s rovnakým číslom majú vo všetkých konfiguráciách rovnaký
+seed, takže jedno kolo je jeden blok Friedmanovho testu. Po min_runs
+kolách sa po každom kole otestuje, či sa konfigurácie líšia; ak áno,
+párovým (post-hoc) porovnaním sa vyradia tie, ktoré sú významne horšie
+ako najlepšia. Ušetrené behy dostanú zvyšné konfigurácie.
+
+Štatistiky sú implementované priamo (bez SciPy): rozdelenie chí-kvadrát
+cez regularizovanú neúplnú gama funkciu a Studentovo t-rozdelenie cez
+regularizovanú neúplnú beta funkciu.
+"""
+
+import math
+
+import numpy as np
+
+
+# ============================================================================
+# Rozdelenia (horné chvosty)
+# ============================================================================
+
+def _gamma_q(a, x, iterations=500, eps=1e-15):
+    """Regularizovaná horná neúplná gama funkcia Q(a, x)"""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Rad pre dolnú funkciu P(a, x), Q = 1 - P
+        term = total = 1.0 / a
+        for n in range(1, iterations):
+            term *= x / (a + n)
+            total += term
+            if abs(term) < abs(total) * eps:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+    # Reťazový zlomok (Lentzov algoritmus)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for n in range(1, iterations):
+        an = -n * (n - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < eps:
+            break
+    return math.exp(log_prefix) * h
+
+
+def _beta_continued_fraction(a, b, x, iterations=500, eps=1e-15):
+    """Reťazový zlomok pre regularizovanú neúplnú beta funkciu"""
+    tiny = 1e-300
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = tiny if abs(d) < tiny else d
+    d = 1 / d
+    h = d
+    for m in range(1, iterations):
+        # Párny krok
+        coefficient = m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m))
+        d = 1 + coefficient * d
+        d = tiny if abs(d) < tiny else d
+        c = 1 + coefficient / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        h *= d * c
+        # Nepárny krok
+        coefficient = -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))
+        d = 1 + coefficient * d
+        d = tiny if abs(d) < tiny else d
+        c = 1 + coefficient / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < eps:
+            break
+    return h
+
+
+def _beta_i(a, b, x):
+    """Regularizovaná neúplná beta funkcia I_x(a, b)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    log_prefix = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                  + a * math.log(x) + b * math.log1p(-x))
+    # Reťazový zlomok konverguje rýchlo len pre x < (a + 1) / (a + b + 2)
+    if x < (a + 1) / (a + b + 2):
+        return math.exp(log_prefix) * _beta_continued_fraction(a, b, x) / a
+    return 1 - math.exp(log_prefix) * _beta_continued_fraction(b, a, 1 - x) / b
+
+
+def chi2_sf(x, df):
+    """P(X >= x) pre X s rozdelením chí-kvadrát s df stupňami voľnosti"""
+    if df <= 0:
+        raise ValueError("df musí byť kladné")
+    return _gamma_q(df / 2, x / 2)
+
+
+def t_sf_two_sided(t, df):
+    """P(|T| >= |t|) pre T so Studentovým t-rozdelením s df stupňami voľnosti"""
+    if df <= 0:
+        raise ValueError("df musí byť kladné")
+    return _beta_i(df / 2, 0.5, df / (df + t * t))
+
+
+# ============================================================================
+# Friedmanov test
+# ============================================================================
+
+def _rank_rows(values):
+    """
+    Poradia v každom riadku (1 = najvyššia hodnota, zhody dostanú priemer)
+
+    Algoritmus maximalizuje fitness, preto je najlepšia najvyššia hodnota.
+    """
+    values = np.asarray(values, dtype=float)
+    ranks = np.empty_like(values)
+    for row, row_values in enumerate(values):
+        order = np.argsort(-row_values, kind='stable')
+        sorted_values = row_values[order]
+        position = 0
+        while position < len(order):
+            end = position
+            while end + 1 < len(order) and sorted_values[end + 1] == sorted_values[position]:
+                end += 1
+            ranks[row, order[position:end + 1]] = (position + end) / 2 + 1
+            position = end + 1
+    return ranks
+
+
+def friedman_test(values):
+    """
+    Friedmanov test pre maticu výsledkov (bloky x konfigurácie)
+
+    values[i, j]: fitness konfigurácie j v bloku (seede) i - vyššia je lepšia
+
+    Vráti slovník:
+    - statistic: Friedmanova štatistika (so zohľadnením zhôd)
+    - p_value: P-hodnota z rozdelenia chí-kvadrát s k - 1 stupňami voľnosti
+    - rank_sums: súčty poradí konfigurácií (nižší je lepší)
+    - ranks: matica poradí
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2 or values.shape[0] < 2 or values.shape[1] < 2:
+        raise ValueError("Friedmanov test potrebuje aspoň 2 bloky a 2 konfigurácie")
+    blocks, k = values.shape
+    ranks = _rank_rows(values)
+    rank_sums = ranks.sum(axis=0)
+
+    # Rozptyl poradí - pri zhodách menší ako bez nich
+    denominator = np.sum(ranks ** 2) - blocks * k * (k + 1) ** 2 / 4
+    if denominator <= 0:
+        # Všetky konfigurácie v každom bloku zhodné - žiadny rozdiel
+        statistic, p_value = 0.0, 1.0
+    else:
+        statistic = (k - 1) * np.sum((rank_sums - blocks * (k + 1) / 2) ** 2) / denominator
+        p_value = chi2_sf(statistic, k - 1)
+    return {
+        'statistic': float(statistic),
+        'p_value': float(p_value),
+        'rank_sums': rank_sums,
+        'ranks': ranks,
+    }
+
+
+def worse_than_best(values, alpha=0.05, test=None):
+    """
+    Konfigurácie významne horšie ako najlepšia (post-hoc test po Friedmanovom teste)
+
+    Párové porovnanie súčtov poradí podľa Conovera (ako vo F-race) -
+    rozdiel súčtov poradí sa porovná s kritickou hodnotou t-rozdelenia
+    s (b - 1)(k - 1) stupňami voľnosti.
+
+    values: matica výsledkov (bloky x konfigurácie), vyššia fitness je lepšia
+    test: výsledok friedman_test(values), ak už je vypočítaný
+
+    Vráti zoznam indexov konfigurácií (stĺpcov), ktoré treba vyradiť -
+    prázdny, ak Friedmanov test nezamietne zhodu konfigurácií.
+    """
+    values = np.asarray(values, dtype=float)
+    test = test if test is not None else friedman_test(values)
+    if test['p_value'] >= alpha:
+        return []
+    blocks, k = values.shape
+    rank_sums = test['rank_sums']
+    best = int(np.argmin(rank_sums))
+
+    denominator = np.sum(test['ranks'] ** 2) - blocks * k * (k + 1) ** 2 / 4
+    variance = (2 * blocks * (1 - test['statistic'] / (blocks * (k - 1))) * denominator
+                / ((blocks - 1) * (k - 1)))
+    df = (blocks - 1) * (k - 1)
+
+    worse = []
+    for index in range(k):
+        difference = rank_sums[index] - rank_sums[best]
+        if index == best or difference <= 0:
+            continue
+        if variance <= 0:
+            # Všetky bloky sa zhodujú v poradí - každý rozdiel je významný
+            worse.append(index)
+        elif t_sf_two_sided(difference / math.sqrt(variance), df) < alpha:
+            worse.append(index)
+    return worse
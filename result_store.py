@@ -0,0 +1,127 @@
+"""
+Úložisko výsledkov experimentov, do ktorého sa len pridáva
+
+Každý dokončený beh sa hneď zapíše, takže prerušený experiment nestratí
+hotovú prácu a pri ďalšom spustení sa hotové behy preskočia.
+
+Štruktúra adresára:
+- runs.jsonl - jeden riadok JSON na beh (konfigurácia, seed, fitness,
+  čas, počet evaluácií, ...); malý súbor, číta sa rýchlo
+- arrays/<kľúč>.npz - objemné dáta behu (konvergencia, najlepšie riešenie)
+
+Kľúč behu je odtlačok (základný názov problému, dimenzie, hranice,
+konfigurácia, hlavný seed, číslo behu) - rovnaký beh má vždy rovnaký
+kľúč; názov konfigurácie do neho nepatrí.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+def cell_key(problem_name, dimensions, bounds, config, seed, run):
+    """Kľúč behu (konfigurácia, seed) - hexadecimálny odtlačok jeho parametrov"""
+    description = json.dumps({
+        'problem': problem_name,
+        'dimensions': dimensions,
+        'bounds': [float(b) for b in bounds],
+        'config': config,
+        'seed': seed,
+        'run': run,
+    }, sort_keys=True, default=str)
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+class ResultStore:
+    """Adresár s výsledkami behov (runs.jsonl + arrays/*.npz)"""
+
+    RUNS_FILE = 'runs.jsonl'
+    ARRAYS_DIR = 'arrays'
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.runs_path = os.path.join(directory, self.RUNS_FILE)
+        self.arrays_path = os.path.join(directory, self.ARRAYS_DIR)
+        os.makedirs(self.arrays_path, exist_ok=True)
+        # Kľúče uložených behov -> záznam (načítajú sa pri prvom použití)
+        self._records = None
+
+    def _load(self):
+        if self._records is None:
+            self._records = {}
+            for record in self.iter_records():
+                self._records[record['key']] = record
+        return self._records
+
+    def iter_records(self):
+        """
+        Prejde záznamy behov v poradí zápisu (bez objemných dát)
+
+        Neúplný posledný riadok (prerušený zápis) sa preskočí.
+        """
+        if not os.path.exists(self.runs_path):
+            return
+        with open(self.runs_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __len__(self):
+        return len(self._load())
+
+    def get(self, key):
+        """Záznam behu s daným kľúčom (alebo None)"""
+        return self._load().get(key)
+
+    def master_seed(self):
+        """Hlavný seed prvého uloženého behu (None, ak je úložisko prázdne)"""
+        for record in self._load().values():
+            return record.get('seed')
+        return None
+
+    def append(self, key, record, arrays):
+        """
+        Uloží beh: najprv objemné dáta (.npz), potom riadok do runs.jsonl
+
+        record: slovník s metadátami behu (musí sa dať uložiť do JSON)
+        arrays: slovník polí (napr. convergence, solution)
+
+        Riadok sa zapíše až po dátach, takže beh v runs.jsonl má vždy
+        kompletné dáta; prerušenie medzi tým znamená len zopakovanie behu.
+        """
+        path = os.path.join(self.arrays_path, f"{key}.npz")
+        temp_path = path + '.tmp.npz'
+        np.savez(temp_path, **arrays)
+        os.replace(temp_path, path)
+
+        record = dict(record, key=key)
+        line = json.dumps(record, default=_json_default)
+        with open(self.runs_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._load()[key] = record
+
+    def load_arrays(self, key):
+        """Načíta objemné dáta behu ako slovník polí"""
+        with np.load(os.path.join(self.arrays_path, f"{key}.npz")) as data:
+            return {name: data[name] for name in data.files}
+
+
+def _json_default(value):
+    """Prevod NumPy hodnôt pre json.dumps"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Objekt typu {type(value).__name__} sa nedá uložiť do JSON")
@@ -0,0 +1,199 @@
+"""
+Deklaratívne parametrické štúdie (sweep) zo súboru
+
+Súbor (JSON) popisuje problémy a konfigurácie, ktoré sa majú spustiť:
+
+    {
+        "problems": ["rastrigin", {"name": "partial_rastrigin", "dimensions": 1000}],
+        "base": {"generations": 100, "mutation_rate": 0.1},
+        "configs": [{"name": "Základ"}, {"name": "Elita 3", "elite_size": 3}],
+        "grid": {
+            "num_species": [4, 8],
+            "population_size": [50, 100],
+            "collaboration_size": [1, 3]
+        },
+        "runs": 10,
+        "seed": 1,
+        "race": {"min_runs": 5, "alpha": 0.05}
+    }
+
+- problems: názvy problémov (problems.get_problem) alebo objekty s názvom
+  a počtom dimenzií
+- base: parametre spoločné pre všetky konfigurácie
+- configs: zoznam konfigurácií (predvolene jedna prázdna)
+- grid: každá konfigurácia sa rozšíri o karteziánsky súčin hodnôt
+- runs, seed: počet behov a hlavný seed (dajú sa prepísať z príkazového riadku)
+- race: voliteľný racing (F-race) - true alebo parametre pre
+  ExperimentRunner.run_race; konfigurácie každého problému súťažia
+  zvlášť a významne horšie sa po kolách seedov vyraďujú
+
+Rovnaké konfigurácie (aj s inými názvami) sa spustia len raz. Všetky behy
+(konfigurácia, seed) idú do jedného poolu procesov od najdrahšieho
+a ukladajú sa priebežne do úložiska výsledkov.
+"""
+
+import itertools
+import json
+import os
+
+from experiments import ExperimentRunner, PER_RUN_PATHS, _DEFAULTS, _strip_name
+from problems import get_problem
+
+
+# Parametre algoritmu, ktoré sa dajú nastaviť v štúdii (problém dodá sweep,
+# seed a výpisy nastavuje ExperimentRunner, súbory jedného behu sa nepovoľujú)
+PARAMETERS = set(_DEFAULTS) - {
+    'self', 'fitness_function', 'dimensions', 'bounds', 'seed', 'verbose', *PER_RUN_PATHS
+}
+
+
+def load_sweep(path):
+    """Načíta popis štúdie zo JSON súboru"""
+    with open(path, encoding='utf-8') as f:
+        spec = json.load(f)
+    if not isinstance(spec, dict) or 'problems' not in spec:
+        raise ValueError(f"Súbor '{path}' musí byť JSON objekt s kľúčom 'problems'")
+    unknown = set(spec) - {'problems', 'base', 'configs', 'grid', 'runs', 'seed', 'race'}
+    if unknown:
+        raise ValueError(f"Neznáme kľúče v '{path}': {sorted(unknown)}")
+    _check_parameters(spec, path)
+    if not isinstance(spec.get('race', False), (bool, dict)):
+        raise ValueError(f"Kľúč 'race' v '{path}' musí byť true/false alebo objekt s parametrami")
+    return spec
+
+
+def _check_parameters(spec, path):
+    """Overí názvy parametrov v base, configs a grid (preklep sa nájde hneď)"""
+    sections = [('base', spec.get('base', {})), ('grid', spec.get('grid', {}))]
+    sections += [(f"configs[{k}]", config) for k, config in enumerate(spec.get('configs', []))]
+    for section, parameters in sections:
+        if not isinstance(parameters, dict):
+            raise ValueError(f"'{section}' v '{path}' musí byť JSON objekt")
+        for name in parameters:
+            if name in PER_RUN_PATHS:
+                raise ValueError(f"Parameter '{name}' v '{section}' súboru '{path}' nie je "
+                                 f"v štúdii povolený (všetky behy by zapisovali do rovnakého súboru)")
+            if name not in PARAMETERS and not (name == 'name' and section.startswith('configs')):
+                raise ValueError(f"Neznámy parameter '{name}' v '{section}' súboru '{path}'")
+
+
+def expand_configs(spec):
+    """
+    Rozvinie konfigurácie štúdie: base + každá konfigurácia + každý bod mriežky
+
+    Vráti zoznam konfigurácií (s kľúčom 'name').
+    """
+    base = spec.get('base', {})
+    grid = spec.get('grid', {})
+    names = list(grid)
+    for name in names:
+        if not isinstance(grid[name], list) or not grid[name]:
+            raise ValueError(f"Mriežka '{name}' musí byť neprázdny zoznam hodnôt")
+
+    configs = []
+    for config in spec.get('configs', [{}]):
+        for values in itertools.product(*(grid[name] for name in names)):
+            point = dict(zip(names, values))
+            expanded = {**base, **config, **point}
+            # Názov: názov konfigurácie + hodnoty z mriežky
+            label = ', '.join(f"{name}={value}" for name, value in point.items())
+            title = config.get('name')
+            expanded['name'] = ' | '.join(part for part in (title, label) if part) or 'Konfigurácia'
+            configs.append(expanded)
+    return configs
+
+
+def expand_sweep(spec):
+    """
+    Zostaví experimenty štúdie (pre ExperimentRunner.run_experiments)
+
+    Duplicitné dvojice (problém, konfigurácia) sa vynechajú - rozhoduje
+    obsah konfigurácie, nie jej názov.
+    """
+    experiments = []
+    seen = set()
+    for problem in spec['problems']:
+        if isinstance(problem, str):
+            problem = {'name': problem}
+        fitness_function, dimensions, bounds = get_problem(problem['name'], problem.get('dimensions'))
+        for config in expand_configs(spec):
+            algorithm_config = _strip_name(config)
+            identity = json.dumps([problem['name'], dimensions, algorithm_config], sort_keys=True)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            experiments.append({
+                'problem_name': f"{problem['name']} - {config['name']}",
+                'problem': problem['name'],
+                'fitness_function': fitness_function,
+                'dimensions': dimensions,
+                'bounds': bounds,
+                'config': algorithm_config,
+                'config_name': config['name'],
+                'optimal_value': getattr(fitness_function, 'optimal_value', 0.0)
+            })
+    return experiments
+
+
+def run_sweep(path, output_dir='results', runs=None, workers=1, seed=None, race=None):
+    """
+    Spustí štúdiu zo súboru a uloží výsledky do adresára
+
+    runs, seed: prepíšu hodnoty zo súboru (None = zo súboru; bez nich
+    10 behov a náhodný seed)
+    workers: počet procesov (1 = sekvenčne)
+    race: racing - True, slovník parametrov run_race alebo False
+        (None = podľa súboru)
+
+    Vráti zoznam výsledkov (rovnaký tvar ako experiment_results.json).
+    """
+    spec = load_sweep(path)
+    experiments = expand_sweep(spec)
+    runs = runs if runs is not None else spec.get('runs', 10)
+    seed = seed if seed is not None else spec.get('seed')
+    race = race if race is not None else spec.get('race', False)
+    if race is True:
+        race = {}
+
+    print(f"Štúdia '{path}': {len(experiments)} experimentov x {runs} behov"
+          f"{' (racing)' if race is not False else ''}")
+    os.makedirs(output_dir, exist_ok=True)
+    runner = ExperimentRunner(num_runs=runs, parallel=workers > 1, workers=workers,
+                              seed=seed, store=output_dir)
+    if race is False:
+        results = runner.run_experiments(experiments)
+    else:
+        results = _run_races(runner, experiments, race)
+    for experiment, result in zip(experiments, results):
+        result['config_name'] = experiment['config_name']
+        result['optimal_value'] = experiment['optimal_value']
+
+    output = os.path.join(output_dir, 'experiment_results.json')
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Výsledky uložené do '{output}'")
+    return results
+
+
+def _run_races(runner, experiments, options):
+    """
+    Racing zvlášť pre konfigurácie každého problému
+
+    Problém s jedinou konfiguráciou sa spustí bežne (num_runs behov).
+    Vráti výsledky v poradí experiments.
+    """
+    problems = {}
+    for index, experiment in enumerate(experiments):
+        problem = (experiment['problem_name'].split(' - ')[0], experiment['dimensions'])
+        problems.setdefault(problem, []).append(index)
+
+    results = [None] * len(experiments)
+    for indices in problems.values():
+        group = [experiments[index] for index in indices]
+        if len(group) > 1:
+            group_results = runner.run_race(group, **options)
+        else:
+            group_results = runner.run_experiments(group)
+        for index, result in zip(indices, group_results):
+            results[index] = result
+    return results
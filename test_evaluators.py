@@ -0,0 +1,26 @@
+"""
+Regresné testy evaluátorov (python -m pytest)
+"""
+
+import numpy as np
+import pytest
+
+from evaluators import ProcessPoolEvaluator
+
+
+def double_plus_one(x):
+    """Fitness 2 * x_0 + 1; pre zápornú hodnotu zlyhá"""
+    if x[0] < 0:
+        raise ValueError("záporná hodnota")
+    return 2.0 * x[0] + 1.0
+
+
+def test_batch_after_worker_error_gets_its_own_values():
+    """Odpovede ostatných procesov z chybnej dávky sa nesmú prečítať v ďalšej"""
+    # Chyba v prvom procese - odpoveď druhého procesu sa po nej musí prečítať
+    X = np.array([[-1.0], [1.0], [3.0], [5.0]])
+    with ProcessPoolEvaluator(double_plus_one, workers=2) as evaluator:
+        with pytest.raises(RuntimeError):
+            evaluator.fitness_batch(X)
+        np.testing.assert_array_equal(evaluator.fitness_batch(X + 2), [3.0, 7.0, 11.0, 15.0])
+        np.testing.assert_array_equal(evaluator.fitness_batch(np.abs(X)), [3.0, 3.0, 7.0, 11.0])
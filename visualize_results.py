@@ -3,22 +3,35 @@ Vizualizácia výsledkov experimentov
 """
 
 import json
+import os
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List, Dict
 
 
-def load_results(filename: str = 'experiment_results.json') -> List[Dict]:
-    """Načíta výsledky z JSON súboru"""
+def load_results(filename: str = 'experiment_results.json',
+                 with_convergence: bool = True) -> List[Dict]:
+    """
+    Načíta výsledky z JSON súboru alebo z adresára úložiska výsledkov
+    (ResultStore); z úložiska sa konvergencia číta len pri with_convergence
+    """
+    if os.path.isdir(filename):
+        from experiments import load_stored_results
+        return load_stored_results(filename, with_convergence)
     with open(filename, 'r') as f:
         return json.load(f)
 
 
-def plot_convergence(results: List[Dict], problem_name: str):
+def select_problem(results: List[Dict], problem_name: str) -> List[Dict]:
+    """Výsledky daného problému (názov pred ' - ' v r['problem'])"""
+    return [r for r in results if r['problem'].split(' - ')[0] == problem_name]
+
+
+def plot_convergence(results: List[Dict], problem_name: str, output_dir: str = '.'):
     """Vykreslí konvergenčné krivky pre daný problém"""
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    problem_results = [r for r in results if problem_name in r['problem']]
+    problem_results = select_problem(results, problem_name)
     
     for result in problem_results:
         convergence = result['convergence']
@@ -32,13 +45,14 @@ def plot_convergence(results: List[Dict], problem_name: str):
     ax.legend()
     ax.grid(True, alpha=0.3)
     plt.tight_layout()
-    plt.savefig(f'convergence_{problem_name.replace(" ", "_").lower()}.png', dpi=300)
+    filename = f'convergence_{problem_name.replace(" ", "_").lower()}.png'
+    plt.savefig(os.path.join(output_dir, filename), dpi=300)
     plt.close()
 
 
 def create_summary_table(results: List[Dict], problem_name: str) -> str:
     """Vytvorí súhrnnú tabuľku výsledkov"""
-    problem_results = [r for r in results if problem_name in r['problem']]
+    problem_results = select_problem(results, problem_name)
     
     table = f"\n{'='*80}\n"
     table += f"Výsledky: {problem_name}\n"
@@ -60,16 +74,11 @@ def create_summary_table(results: List[Dict], problem_name: str) -> str:
     return table
 
 
-def plot_comparison(results: List[Dict]):
+def plot_comparison(results: List[Dict], output_dir: str = '.'):
     """Vykreslí porovnanie výsledkov"""
     # Zoskupiť podľa problému
-    problems = set()
-    for r in results:
-        problem_base = r['problem'].split(' - ')[0]
-        problems.add(problem_base)
-    
-    for problem in problems:
-        plot_convergence(results, problem)
+    for problem in problem_groups(results):
+        plot_convergence(results, problem, output_dir)
     
     # Porovnanie priemerných výsledkov
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -107,39 +116,63 @@ def plot_comparison(results: List[Dict]):
         ax2.grid(True, alpha=0.3, axis='y')
     
     plt.tight_layout()
-    plt.savefig('comparison.png', dpi=300)
+    plt.savefig(os.path.join(output_dir, 'comparison.png'), dpi=300)
     plt.close()
 
 
+def problem_groups(results: List[Dict]) -> List[str]:
+    """Základné názvy problémov (časť pred ' - ') v poradí výskytu"""
+    problems = []
+    for r in results:
+        problem_base = r['problem'].split(' - ')[0]
+        if problem_base not in problems:
+            problems.append(problem_base)
+    return problems
+
+
+def visualize(filename: str = 'experiment_results.json', output_dir: str = '.') -> int:
+    """
+    Vytvorí tabuľky a grafy z výsledkov v súbore (alebo úložisku) filename
+    a uloží ich do adresára output_dir
+
+    Vráti počet spracovaných výsledkov (chyby sa šíria ďalej).
+    """
+    results = load_results(filename)
+    
+    if not results:
+        print("Žiadne výsledky na načítanie!")
+        return 0
+    
+    os.makedirs(output_dir, exist_ok=True)
+    tables = [create_summary_table(results, problem) for problem in problem_groups(results)]
+    
+    # Vytvoriť tabuľky
+    print("\n" + "="*80)
+    print("SÚHRN VÝSLEDKOV")
+    print("="*80)
+    
+    for table in tables:
+        print(table)
+    
+    # Vytvoriť grafy
+    print("\nGenerovanie grafov...")
+    plot_comparison(results, output_dir)
+    print("Grafy uložené!")
+    
+    # Uložiť tabuľky do súboru
+    summary_path = os.path.join(output_dir, 'results_summary.txt')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        for table in tables:
+            f.write(table)
+    
+    print(f"\nSúhrn uložený do '{summary_path}'")
+    return len(results)
+
+
 def main():
     """Hlavná funkcia"""
     try:
-        results = load_results()
-        
-        if not results:
-            print("Žiadne výsledky na načítanie!")
-            return
-        
-        # Vytvoriť tabuľky
-        print("\n" + "="*80)
-        print("SÚHRN VÝSLEDKOV")
-        print("="*80)
-        
-        print(create_summary_table(results, "Rastrigin"))
-        print(create_summary_table(results, "Model"))
-        
-        # Vytvoriť grafy
-        print("\nGenerovanie grafov...")
-        plot_comparison(results)
-        print("Grafy uložené!")
-        
-        # Uložiť tabuľky do súboru
-        with open('results_summary.txt', 'w', encoding='utf-8') as f:
-            f.write(create_summary_table(results, "Rastrigin"))
-            f.write(create_summary_table(results, "Model"))
-        
-        print("\nSúhrn uložený do 'results_summary.txt'")
-        
+        visualize()
     except FileNotFoundError:
         print("Súbor 'experiment_results.json' nebol nájdený!")
         print("Najprv spustite 'experiments.py' na vygenerovanie výsledkov.")
@@ -149,4 +182,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-